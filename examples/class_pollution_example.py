@@ -9,9 +9,10 @@ import json
 
 
 class ExampleClass:
+    safe_attributes = frozenset({'id', 'name', 'value', 'status'})  # Safe whitelist
+
     def __init__(self):
         self.data = {}
-        self.safe_attributes = {'id', 'name', 'value', 'status'}  # Safe whitelist
     
     def unsafe_merge(self, user_input):
         """Unsafe merge that could lead to class pollution"""
@@ -139,7 +140,7 @@ def json_parsing_example(json_data):
     # B701: Using JSON keys as attribute names
     for key, value in json_data.items():
         # Skip dangerous keys to prevent runtime crashes
-        if key.startswith('__') and key.endswith('__'):
+        if key[:2] == '__' == key[-2:]:
             continue
         setattr(obj, key, value)
     
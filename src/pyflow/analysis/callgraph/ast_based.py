@@ -8,10 +8,29 @@ call relationships in Python source code.
 
 import ast
 from typing import Dict, Set, List, Tuple, Any
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from .callgraph import CallGraph
 
+# Fields holding nested statements, or the handler/case nodes that hold them,
+# in the order they appear in the AST node definitions.
+_STATEMENT_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+
+def _iter_statements(root):
+    """
+    Yield `root` and every statement-level node below it.
+
+    Nodes come out in the same breadth-first order as `ast.walk`, but
+    expression subtrees are never entered: they cannot contain definitions.
+    """
+    todo = deque([root])
+    while todo:
+        node = todo.popleft()
+        for field in _STATEMENT_FIELDS:
+            todo.extend(getattr(node, field, ()))
+        yield node
+
 
 def extract_call_graph(source_code: str) -> CallGraph:
     """
@@ -31,22 +50,22 @@ def extract_call_graph(source_code: str) -> CallGraph:
     try:
         tree = ast.parse(source_code)
 
-        # First pass: collect all function definitions
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
+        # First pass: collect all function definitions, remembering the nodes
+        # so the second pass does not have to walk the whole tree again
+        function_defs = []
+        for node in _iter_statements(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 # Use qualified names like 'main.func'
                 qualified_name = f"{main_function}.{node.name}"
                 function_names.add(node.name)
                 function_names.add(qualified_name)
+                function_defs.append(node)
 
-        # Second pass: find calls within functions and module-level code
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                caller_name = node.name
-                _analyze_function_calls(node, caller_name, function_names, graph)
-            elif isinstance(node, ast.Module):
-                # Handle module-level calls (treat as 'main' function)
-                _analyze_module_calls(node, main_function, function_names, graph)
+        # Second pass: find calls within module-level code (treated as the
+        # 'main' function) and then within each function
+        _analyze_module_calls(tree, main_function, function_names, graph)
+        for node in function_defs:
+            _analyze_function_calls(node, node.name, function_names, graph)
 
     except SyntaxError:
         # If parsing fails, return empty graph
@@ -67,13 +86,12 @@ def _analyze_function_calls(func_node, caller_name, function_names, graph):
 
 def _analyze_module_calls(module_node, caller_name, function_names, graph):
     """Analyze function calls at module level."""
-    # Set parent references for easier navigation
-    for child in ast.walk(module_node):
-        child._parent = module_node
-
-    for child in ast.iter_child_nodes(module_node):
+    for child in module_node.body:
         if isinstance(child, ast.Assign):
             # Handle cases like: a = func; a()()
+            # Only assignments need the parent reference, to find the
+            # statements that follow them
+            child._parent = module_node
             _analyze_assignment_and_call(child, caller_name, function_names, graph)
         elif isinstance(child, ast.Expr) and isinstance(child.value, ast.Call):
             # Handle direct calls like func()
@@ -85,12 +103,13 @@ def _analyze_call_node(call_node, caller_name, function_names, graph):
     if isinstance(call_node.func, ast.Name):
         # Direct function call like func()
         callee_name = call_node.func.id
-        # Try both simple name and qualified name
-        qualified_callee = f"main.{callee_name}"
+        # Try the simple name first, only building the qualified name on a miss
         if callee_name in function_names:
             graph.add_edge(caller_name, callee_name)
-        elif qualified_callee in function_names:
-            graph.add_edge(caller_name, qualified_callee)
+        else:
+            qualified_callee = f"main.{callee_name}"
+            if qualified_callee in function_names:
+                graph.add_edge(caller_name, qualified_callee)
     elif isinstance(call_node.func, ast.Attribute):
         # Method call like obj.method()
         if isinstance(call_node.func.value, ast.Name):
@@ -126,6 +145,7 @@ def _find_subsequent_calls(assign_node, var_name, func_name, caller_name, functi
     """Find calls to a variable after it's been assigned a function."""
     parent = getattr(assign_node, '_parent', None)
     if parent and hasattr(parent, 'body'):
+        qualified_func = f"main.{func_name}"
         try:
             assign_idx = parent.body.index(assign_node)
             # Look at subsequent statements
@@ -137,7 +157,6 @@ def _find_subsequent_calls(assign_node, var_name, func_name, caller_name, functi
                         # This is a call like a()
                         if not call.args and not call.keywords:
                             # Simple call like a() - treat as calling the assigned function
-                            qualified_func = f"main.{func_name}"
                             if qualified_func in function_names:
                                 graph.add_edge(caller_name, qualified_func)
                             else:
@@ -149,7 +168,6 @@ def _find_subsequent_calls(assign_node, var_name, func_name, caller_name, functi
                             if isinstance(inner_call.func, ast.Name) and inner_call.func.id == var_name:
                                 # This is a()() where a() returns a function that gets called
                                 # The inner a() should call func_name
-                                qualified_func = f"main.{func_name}"
                                 if qualified_func in function_names:
                                     graph.add_edge(caller_name, qualified_func)
                                 else:
@@ -161,10 +179,13 @@ def _find_subsequent_calls(assign_node, var_name, func_name, caller_name, functi
 def _analyze_assignment_and_call(assign_node, caller_name, function_names, graph):
     """Analyze assignment followed by calls, like a = func; a()()."""
     # Check if this is an assignment of a function to a variable
+    if not isinstance(assign_node.value, ast.Name):
+        return
+    func_name = assign_node.value.id
+
     for target in assign_node.targets:
-        if isinstance(target, ast.Name) and isinstance(assign_node.value, ast.Name):
+        if isinstance(target, ast.Name):
             var_name = target.id
-            func_name = assign_node.value.id
             if func_name in function_names:
                 # This is like: a = func
                 # Mark this as a call from main to func
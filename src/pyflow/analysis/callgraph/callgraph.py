@@ -26,6 +26,8 @@ class CallGraph:
     support richer output formats when available.
     """
 
+    __slots__ = ("_graph", "_modules")
+
     def __init__(self) -> None:
         self._graph: MutableMapping[str, MutableSet[str]] = defaultdict(set)
         self._modules: Dict[str, str] = {}
@@ -57,6 +59,19 @@ class CallGraph:
         self.add_node(callee)
         self._graph[caller].add(callee)
 
+    def add_edges(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """
+        Record several (caller, callee) invocations at once.
+
+        Equivalent to calling `add_edge` for each pair, without the per-edge
+        method call overhead.
+        """
+        graph = self._graph
+        for caller, callee in pairs:
+            graph[caller].add(callee)
+            if callee not in graph:
+                graph[callee] = set()
+
     # ---------------------------------------------------------------- queries
     def get(self) -> Dict[str, Set[str]]:
         """Return a plain dictionary view of the graph."""
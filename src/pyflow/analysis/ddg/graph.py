@@ -5,7 +5,8 @@ Nodes correspond to dataflowIR ops and slots; edges capture def-use and
 memory dependences between producers and consumers.
 """
 
-from typing import Dict, List, Set, Optional, Any
+from array import array
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 
 
 class DDGEdge(object):
@@ -22,79 +23,195 @@ class DDGEdge(object):
 
 
 class DDGNode(object):
-    __slots__ = ("node_id", "ir_node", "category", "edges_in", "edges_out")
+    __slots__ = ("node_id", "ir_node", "category", "graph")
 
-    def __init__(self, node_id: int, ir_node: Any, category: str):
+    def __init__(self, node_id: int, ir_node: Any, category: str, graph: "DataDependenceGraph" = None):
         self.node_id = node_id
         self.ir_node = ir_node  # dataflowIR.OpNode, SlotNode, or SSA Phi/Local
         self.category = category  # "op", "slot", "phi"
-        self.edges_in: Set[DDGEdge] = set()
-        self.edges_out: Set[DDGEdge] = set()
+        self.graph = graph
 
-    def add_edge_to(self, other: "DDGNode", kind: str, label: str = ""):
-        edge = DDGEdge(self, other, kind, label)
-        self.edges_out.add(edge)
-        other.edges_in.add(edge)
-        return edge
+    # Edges are stored once, packed in the owning graph; these are read-only views
+    @property
+    def edges_out(self) -> Tuple[DDGEdge, ...]:
+        return self.graph.out_edges(self)
+
+    @property
+    def edges_in(self) -> Tuple[DDGEdge, ...]:
+        return self.graph.in_edges(self)
 
     def __repr__(self):
         return "DDGNode(%d,%s)" % (self.node_id, self.category)
 
-    def __hash__(self):
-        return self.node_id
 
-    def __eq__(self, other):
-        return isinstance(other, DDGNode) and self.node_id == other.node_id
+# Compact codes for DDGNode.category, used by the per-graph category array
+CATEGORY_CODES = {"op": 0, "slot": 1, "phi": 2}
+
+# Edge kinds produced by DataDependenceGraph
+KIND_DEF_USE = "def-use"
+KIND_MEMORY = "memory"
 
 
 class DataDependenceGraph(object):
-    __slots__ = ("nodes", "_id", "op_node_map", "slot_node_map")
+    __slots__ = ("nodes", "_categories", "_id", "op_node_map", "slot_node_map", "_edge_index", "_csr")
 
     def __init__(self):
         self.nodes: List[DDGNode] = []
+        # One CATEGORY_CODES byte per node, parallel to self.nodes
+        self._categories = bytearray()
         self._id = 0
         self.op_node_map: Dict[Any, DDGNode] = {}
         self.slot_node_map: Dict[Any, DDGNode] = {}
+        # (source id, target id, kind) -> label, in insertion order.  This is
+        # only the build-time dedupe index; freeze() packs it into _csr and
+        # drops it, so a frozen graph keeps no per-edge Python objects.
+        self._edge_index: Dict[Tuple[int, int, str], str] = {}
+        # Compressed sparse row view of the edges, see freeze()
+        self._csr: Optional[Tuple[array, array, array, List[str], List[str]]] = None
 
     def _new_id(self) -> int:
         nid = self._id
         self._id += 1
         return nid
 
+    def _new_node(self, ir_node: Any, category: str) -> DDGNode:
+        node = DDGNode(self._new_id(), ir_node, category, self)
+        self.nodes.append(node)
+        self._categories.append(CATEGORY_CODES[category])
+        return node
+
     def get_or_create_op_node(self, ir_op: Any) -> DDGNode:
         node = self.op_node_map.get(ir_op)
         if node is None:
-            node = DDGNode(self._new_id(), ir_op, "op")
-            self.nodes.append(node)
+            node = self._new_node(ir_op, "op")
             self.op_node_map[ir_op] = node
         return node
 
     def get_or_create_slot_node(self, ir_slot: Any) -> DDGNode:
         node = self.slot_node_map.get(ir_slot)
         if node is None:
-            node = DDGNode(self._new_id(), ir_slot, "slot")
-            self.nodes.append(node)
+            node = self._new_node(ir_slot, "slot")
             self.slot_node_map[ir_slot] = node
         return node
 
-    def add_def_use(self, def_node: DDGNode, use_node: DDGNode, label: str = ""):
-        return def_node.add_edge_to(use_node, "def-use", label)
-
-    def add_mem_dep(self, src: DDGNode, dst: DDGNode, label: str = ""):
-        return src.add_edge_to(dst, "memory", label)
+    def _add_edge(self, src: DDGNode, dst: DDGNode, kind: str, label: str) -> DDGEdge:
+        if self._csr is not None:
+            self._thaw()
+        key = (src.node_id, dst.node_id, kind)
+        label = self._edge_index.setdefault(key, label)
+        # The edge object is only a view for the caller; the graph keeps the key
+        return DDGEdge(src, dst, kind, label)
+
+    def add_def_use(self, def_node: DDGNode, use_node: DDGNode, label: str = "") -> DDGEdge:
+        return self._add_edge(def_node, use_node, KIND_DEF_USE, label)
+
+    def add_mem_dep(self, src: DDGNode, dst: DDGNode, label: str = "") -> DDGEdge:
+        return self._add_edge(src, dst, KIND_MEMORY, label)
+
+    def freeze(self) -> None:
+        """
+        Pack the edges into flat compressed sparse row arrays.
+
+        Node ids are the indices into self.nodes, so the out edges of node i
+        are dst[row_ptr[i]:row_ptr[i + 1]], with a parallel array of one-byte
+        codes into the kind names and a parallel list of labels.  Edges of a
+        node keep the order they were added in.  Adding an edge afterwards
+        unpacks the graph again.
+        """
+        if self._csr is not None:
+            return
+
+        index = self._edge_index
+        num_edges = len(index)
+        row_ptr = array("i", [0]) * (len(self.nodes) + 1)
+        for src, _, _ in index:
+            row_ptr[src + 1] += 1
+        for i in range(len(self.nodes)):
+            row_ptr[i + 1] += row_ptr[i]
+
+        # Counting sort by source id; the cursor copy tracks the next free
+        # position of each row
+        cursor = array("i", row_ptr)
+        dst = array("i", [0]) * num_edges
+        kinds = array("B", [0]) * num_edges
+        labels = [""] * num_edges
+        kind_names: List[str] = []
+        kind_codes: Dict[str, int] = {}
+        for (src, target, kind), label in index.items():
+            code = kind_codes.get(kind)
+            if code is None:
+                code = kind_codes[kind] = len(kind_names)
+                kind_names.append(kind)
+            pos = cursor[src]
+            cursor[src] = pos + 1
+            dst[pos] = target
+            kinds[pos] = code
+            labels[pos] = label
+
+        self._csr = (row_ptr, dst, kinds, kind_names, labels)
+        self._edge_index = {}
+
+    def _thaw(self) -> None:
+        """Rebuild the dedupe index from the packed view so edges can be added."""
+        self._edge_index = {
+            (src, dst, kind): label for src, dst, kind, label in self._iter_packed()
+        }
+        self._csr = None
+
+    def _iter_packed(self) -> Iterator[Tuple[int, int, str, str]]:
+        if self._csr is None:
+            self.freeze()
+
+        row_ptr, dst, kinds, kind_names, labels = self._csr
+        for src in range(len(row_ptr) - 1):
+            for i in range(row_ptr[src], row_ptr[src + 1]):
+                yield src, dst[i], kind_names[kinds[i]], labels[i]
+
+    def iter_edges(self) -> Iterator[Tuple[int, int, str]]:
+        """Yield (source id, target id, kind) for every edge."""
+        for src, dst, kind, _ in self._iter_packed():
+            yield src, dst, kind
+
+    def num_edges(self) -> int:
+        if self._csr is None:
+            return len(self._edge_index)
+        return len(self._csr[1])
+
+    def out_edges(self, node: DDGNode) -> Tuple[DDGEdge, ...]:
+        """The edges leaving node, read from its CSR row."""
+        if self._csr is None:
+            self.freeze()
+
+        row_ptr, dst, kinds, kind_names, labels = self._csr
+        nodes = self.nodes
+        start, end = row_ptr[node.node_id], row_ptr[node.node_id + 1]
+        return tuple(
+            DDGEdge(node, nodes[dst[i]], kind_names[kinds[i]], labels[i])
+            for i in range(start, end)
+        )
+
+    def in_edges(self, node: DDGNode) -> Tuple[DDGEdge, ...]:
+        """The edges entering node.  There is no reverse index, so this scans every edge."""
+        nodes = self.nodes
+        target = node.node_id
+        return tuple(
+            DDGEdge(nodes[src], node, kind, label)
+            for src, dst, kind, label in self._iter_packed()
+            if dst == target
+        )
 
     def all_edges(self) -> List[DDGEdge]:
-        result: List[DDGEdge] = []
-        for n in self.nodes:
-            result.extend(n.edges_out)
-        return result
+        """Materialise every edge as a DDGEdge, in iter_edges() order."""
+        nodes = self.nodes
+        return [
+            DDGEdge(nodes[src], nodes[dst], kind, label)
+            for src, dst, kind, label in self._iter_packed()
+        ]
 
     def stats(self) -> Dict[str, Any]:
         return {
             "nodes": len(self.nodes),
-            "edges": len(self.all_edges()),
-            "ops": sum(1 for n in self.nodes if n.category == "op"),
-            "slots": sum(1 for n in self.nodes if n.category == "slot"),
+            "edges": self.num_edges(),
+            "ops": self._categories.count(CATEGORY_CODES["op"]),
+            "slots": self._categories.count(CATEGORY_CODES["slot"]),
         }
-
-
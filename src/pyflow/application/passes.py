@@ -5,7 +5,7 @@ This module provides wrapper passes for the existing PyFlow analysis and
 optimization modules, allowing them to work with the new pass manager system.
 """
 
-from .passmanager import AnalysisPass, OptimizationPass, PassResult
+from .passmanager import AnalysisPass, OptimizationPass, PassResult, catching
 from pyflow.analysis import ipa, cpa, lifetimeanalysis
 from pyflow.optimization import methodcall, simplify, clone, argumentnormalization, cullprogram, storeelimination
 
@@ -16,13 +16,11 @@ class IPAAnalysisPass(AnalysisPass):
     def __init__(self):
         super().__init__("ipa", "Inter-procedural analysis for call graphs and contexts")
 
+    @catching
     def run(self, compiler, program) -> PassResult:
-        try:
-            result = ipa.evaluate(compiler, program)
-            program.ipa_analysis = result
-            return PassResult(success=True, changed=result is not None, data=result)
-        except Exception as e:
-            return PassResult(success=False, error=str(e))
+        result = ipa.evaluate(compiler, program)
+        program.ipa_analysis = result
+        return PassResult(success=True, changed=result is not None, data=result)
 
 
 class CPAAnalysisPass(AnalysisPass):
@@ -31,13 +29,11 @@ class CPAAnalysisPass(AnalysisPass):
     def __init__(self):
         super().__init__("cpa", "Constraint-based analysis for type and flow constraints")
 
+    @catching
     def run(self, compiler, program) -> PassResult:
-        try:
-            # Run CPA with default parameters
-            cpa_result = cpa.evaluate(compiler, program)
-            return PassResult(success=True, changed=True, data=cpa_result)
-        except Exception as e:
-            return PassResult(success=False, error=str(e))
+        # Run CPA with default parameters
+        cpa_result = cpa.evaluate(compiler, program)
+        return PassResult(success=True, changed=True, data=cpa_result)
 
 
 class LifetimeAnalysisPass(AnalysisPass):
@@ -46,12 +42,10 @@ class LifetimeAnalysisPass(AnalysisPass):
     def __init__(self):
         super().__init__("lifetime", "Analyzes lifetimes of variables and objects")
 
+    @catching
     def run(self, compiler, program) -> PassResult:
-        try:
-            lifetimeanalysis.evaluate(compiler, program)
-            return PassResult(success=True, changed=True)
-        except Exception as e:
-            return PassResult(success=False, error=str(e))
+        lifetimeanalysis.evaluate(compiler, program)
+        return PassResult(success=True, changed=True)
 
 
 class MethodCallOptimizationPass(OptimizationPass):
@@ -60,12 +54,10 @@ class MethodCallOptimizationPass(OptimizationPass):
     def __init__(self):
         super().__init__("methodcall", "Optimizes method calls and dispatch")
 
+    @catching
     def run(self, compiler, program) -> PassResult:
-        try:
-            methodcall.evaluate(compiler, program)
-            return PassResult(success=True, changed=True)
-        except Exception as e:
-            return PassResult(success=False, error=str(e))
+        methodcall.evaluate(compiler, program)
+        return PassResult(success=True, changed=True)
 
 
 class SimplifyOptimizationPass(OptimizationPass):
@@ -74,12 +66,10 @@ class SimplifyOptimizationPass(OptimizationPass):
     def __init__(self):
         super().__init__("simplify", "Constant folding, dead code elimination, and simplification")
 
+    @catching
     def run(self, compiler, program) -> PassResult:
-        try:
-            simplify.evaluate(compiler, program)
-            return PassResult(success=True, changed=True)
-        except Exception as e:
-            return PassResult(success=False, error=str(e))
+        simplify.evaluate(compiler, program)
+        return PassResult(success=True, changed=True)
 
 
 class CloneOptimizationPass(OptimizationPass):
@@ -88,12 +78,10 @@ class CloneOptimizationPass(OptimizationPass):
     def __init__(self):
         super().__init__("clone", "Separates different invocations of the same code")
 
+    @catching
     def run(self, compiler, program) -> PassResult:
-        try:
-            clone.evaluate(compiler, program)
-            return PassResult(success=True, changed=True)
-        except Exception as e:
-            return PassResult(success=False, error=str(e))
+        clone.evaluate(compiler, program)
+        return PassResult(success=True, changed=True)
 
 
 class ArgumentNormalizationPass(OptimizationPass):
@@ -102,12 +90,10 @@ class ArgumentNormalizationPass(OptimizationPass):
     def __init__(self):
         super().__init__("argument_normalization", "Normalizes function arguments, eliminates *args, **kwargs")
 
+    @catching
     def run(self, compiler, program) -> PassResult:
-        try:
-            argumentnormalization.evaluate(compiler, program)
-            return PassResult(success=True, changed=True)
-        except Exception as e:
-            return PassResult(success=False, error=str(e))
+        argumentnormalization.evaluate(compiler, program)
+        return PassResult(success=True, changed=True)
 
 
 class ProgramCullingPass(OptimizationPass):
@@ -116,12 +102,10 @@ class ProgramCullingPass(OptimizationPass):
     def __init__(self):
         super().__init__("cull_program", "Removes dead functions and contexts")
 
+    @catching
     def run(self, compiler, program) -> PassResult:
-        try:
-            cullprogram.evaluate(compiler, program)
-            return PassResult(success=True, changed=True)
-        except Exception as e:
-            return PassResult(success=False, error=str(e))
+        cullprogram.evaluate(compiler, program)
+        return PassResult(success=True, changed=True)
 
 
 class StoreEliminationPass(OptimizationPass):
@@ -130,12 +114,10 @@ class StoreEliminationPass(OptimizationPass):
     def __init__(self):
         super().__init__("store_elimination", "Eliminates redundant store operations")
 
+    @catching
     def run(self, compiler, program) -> PassResult:
-        try:
-            storeelimination.evaluate(compiler, program)
-            return PassResult(success=True, changed=True)
-        except Exception as e:
-            return PassResult(success=False, error=str(e))
+        storeelimination.evaluate(compiler, program)
+        return PassResult(success=True, changed=True)
 
 
 # Registry of standard passes
@@ -175,3 +157,6 @@ def register_standard_passes(pass_manager):
         if opt_name in pass_manager.passes:
             opt_pass = pass_manager.passes[opt_name]
             opt_pass.info.dependencies.add("simplify")
+
+    # Dependencies were added after registration, so re-resolve the order
+    pass_manager.invalidate_pass_order()
@@ -14,6 +14,7 @@ while maintaining correctness and efficiency.
 
 import time
 import hashlib
+import functools
 from typing import Dict, List, Set, Optional, Any, Callable, Type
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -31,6 +32,8 @@ class PassKind(Enum):
 class PassResult:
     """Result of running a pass."""
 
+    __slots__ = ("success", "changed", "data", "error", "timestamp")
+
     def __init__(self, success: bool = True, changed: bool = False,
                  data: Any = None, error: Optional[str] = None):
         self.success = success
@@ -43,6 +46,17 @@ class PassResult:
         return self.success
 
 
+def catching(run: Callable) -> Callable:
+    """Decorate a pass's run method so exceptions become a failed PassResult."""
+    @functools.wraps(run)
+    def wrapper(self, compiler, program) -> PassResult:
+        try:
+            return run(self, compiler, program)
+        except Exception as e:
+            return PassResult(success=False, error=str(e))
+    return wrapper
+
+
 @dataclass
 class PassInfo:
     """Metadata for a registered pass."""
@@ -186,7 +200,8 @@ class PassManager:
 
     def __init__(self, enable_caching: bool = True):
         self.passes: Dict[str, Pass] = {}
-        self.pass_order: List[str] = []
+        self._registration_order: List[str] = []
+        self._order_cache: Optional[List[str]] = None
         self.cache = PassCache() if enable_caching else None
         self.execution_log: List[Dict[str, Any]] = []
 
@@ -196,19 +211,32 @@ class PassManager:
             raise ValueError(f"Pass '{pass_instance.name}' already registered")
 
         self.passes[pass_instance.name] = pass_instance
-        self.pass_order.append(pass_instance.name)
-
-        # Recompute pass ordering based on dependencies
-        self._resolve_dependencies()
+        self._registration_order.append(pass_instance.name)
+        self.invalidate_pass_order()
 
     def unregister_pass(self, pass_name: str) -> None:
         """Unregister a pass."""
         if pass_name in self.passes:
             del self.passes[pass_name]
-            self.pass_order = [p for p in self.pass_order if p != pass_name]
-            self._resolve_dependencies()
+            self._registration_order.remove(pass_name)
+            self.invalidate_pass_order()
+
+    @property
+    def pass_order(self) -> List[str]:
+        """Pass execution order, resolved from dependencies on first access."""
+        if self._order_cache is None:
+            self._order_cache = self._resolve_dependencies()
+        return self._order_cache
 
-    def _resolve_dependencies(self) -> None:
+    def invalidate_pass_order(self) -> None:
+        """Drop the cached pass order.
+
+        Call this after editing the dependencies of an already registered pass
+        so the next access to `pass_order` re-resolves them.
+        """
+        self._order_cache = None
+
+    def _resolve_dependencies(self) -> List[str]:
         """Resolve pass execution order based on dependencies."""
         # Simple topological sort based on dependencies
         visited = set()
@@ -232,11 +260,11 @@ class PassManager:
                 order.append(pass_name)
 
         # Visit all passes
-        for pass_name in list(self.pass_order):
+        for pass_name in self._registration_order:
             if pass_name not in visited:
                 visit(pass_name)
 
-        self.pass_order = order
+        return order
 
     def build_pipeline(self, pass_names: List[str]) -> "PassPipeline":
         """Build a pipeline from a list of pass names."""
@@ -245,11 +273,20 @@ class PassManager:
     def run_pipeline(self, compiler, program, pipeline: "PassPipeline") -> Dict[str, PassResult]:
         """Run a pipeline of passes."""
         results = {}
+        failed: Set[str] = set()
 
         for pass_name in pipeline.passes:
             if pass_name not in self.passes:
                 raise ValueError(f"Unknown pass '{pass_name}' in pipeline")
 
+            # Don't run passes whose dependencies already failed in this run
+            failed_deps = self.passes[pass_name].info.dependencies & failed
+            if failed_deps:
+                results[pass_name] = PassResult(
+                    success=False, error=f"Skipped, dependency failed: {', '.join(sorted(failed_deps))}")
+                failed.add(pass_name)
+                continue
+
             # Check if we can skip this pass (caching)
             if self.cache:
                 cached = self.cache.get(program, pass_name)
@@ -262,6 +299,8 @@ class PassManager:
             result = self._run_pass(pass_obj, compiler, program)
 
             results[pass_name] = result
+            if not result.success:
+                failed.add(pass_name)
 
             # Cache the result
             if self.cache and result.success:
@@ -385,17 +424,15 @@ def create_analysis_pass(name: str, run_func: Callable, description: str = "") -
             super().__init__(name, description)
             self._run_func = run_func
 
+        @catching
         def run(self, compiler, program) -> PassResult:
-            try:
-                # Assume the function returns (changed, data)
-                result = self._run_func(compiler, program)
-                if isinstance(result, tuple):
-                    changed, data = result
-                    return PassResult(success=True, changed=changed, data=data)
-                else:
-                    return PassResult(success=True, changed=result, data=result)
-            except Exception as e:
-                return PassResult(success=False, error=str(e))
+            # Assume the function returns (changed, data)
+            result = self._run_func(compiler, program)
+            if isinstance(result, tuple):
+                changed, data = result
+                return PassResult(success=True, changed=changed, data=data)
+            else:
+                return PassResult(success=True, changed=result, data=result)
 
     return FunctionAnalysisPass()
 
@@ -407,15 +444,13 @@ def create_optimization_pass(name: str, run_func: Callable, description: str = "
             super().__init__(name, description)
             self._run_func = run_func
 
+        @catching
         def run(self, compiler, program) -> PassResult:
-            try:
-                result = self._run_func(compiler, program)
-                if isinstance(result, tuple):
-                    changed, data = result
-                    return PassResult(success=True, changed=changed, data=data)
-                else:
-                    return PassResult(success=True, changed=result, data=result)
-            except Exception as e:
-                return PassResult(success=False, error=str(e))
+            result = self._run_func(compiler, program)
+            if isinstance(result, tuple):
+                changed, data = result
+                return PassResult(success=True, changed=changed, data=data)
+            else:
+                return PassResult(success=True, changed=result, data=result)
 
     return FunctionOptimizationPass()
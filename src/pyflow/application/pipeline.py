@@ -32,13 +32,27 @@ from pyflow.optimization import dce
 # Import stats module
 from .. import stats
 from .. import config
-import threading
+from pyflow.util.application import async_utils
 
 from . import errors
 from .passmanager import PassManager, PassPipeline
 from .passes import register_standard_passes
 
 
+# Passes run by Pipeline.run when the pass manager is enabled, in order
+STANDARD_PIPELINE = (
+    "ipa",           # Inter-procedural analysis first
+    "cpa",           # Constraint propagation analysis
+    "lifetime",      # Lifetime analysis
+    "methodcall",    # Method call optimization
+    "simplify",      # Simplification (constant folding, DCE)
+    "clone",         # Code cloning
+    "argument_normalization",  # Argument normalization
+    "cull_program",  # Program culling
+    "store_elimination",       # Store elimination
+)
+
+
 class Pipeline(object):
     """Main analysis pipeline for PyFlow static analysis.
 
@@ -87,24 +101,15 @@ class Pipeline(object):
             raise RuntimeError("Pass manager not initialized")
 
         # Build a comprehensive pipeline
-        pipeline = self.pass_manager.build_pipeline([
-            "ipa",           # Inter-procedural analysis first
-            "cpa",           # Constraint propagation analysis
-            "lifetime",      # Lifetime analysis
-            "methodcall",    # Method call optimization
-            "simplify",      # Simplification (constant folding, DCE)
-            "clone",         # Code cloning
-            "argument_normalization",  # Argument normalization
-            "cull_program",  # Program culling
-            "store_elimination",       # Store elimination
-        ])
+        pipeline = self.pass_manager.build_pipeline(list(STANDARD_PIPELINE))
 
         # Run the pipeline
+        start = time.perf_counter()
         results = self.pass_manager.run_pipeline(compiler, program, pipeline)
+        total_time = time.perf_counter() - start
 
         # Log execution summary
-        successful = sum(1 for r in results.values() if r.success)
-        total_time = sum(r.time for r in results.values() if hasattr(r, 'time'))
+        successful = sum(r.success for r in results.values())
 
         print(f"Pass Manager: {successful}/{len(results)} passes successful in {total_time:.3f}s")
 
@@ -275,15 +280,13 @@ def evaluate(compiler, prgm, name):
                             raise
 
                 if config.doThreadCleanup:
-                    if threading.activeCount() > 1:
+                    threads = async_utils.live_threads()
+                    if threads:
                         with compiler.console.scope("threading cleanup"):
-                            compiler.console.output(
-                                "Threads: %d" % (threading.activeCount() - 1)
-                            )
-                            for t in threading.enumerate():
-                                if t is not threading.currentThread():
-                                    compiler.console.output(".")
-                                    t.join()
+                            compiler.console.output("Threads: %d" % len(threads))
+                            for t in threads:
+                                compiler.console.output(".")
+                                t.join()
     except errors.CompilerAbort as e:
         print()
         print("ABORT", e)
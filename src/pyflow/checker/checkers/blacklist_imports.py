@@ -12,9 +12,14 @@ def check_blacklisted_imports(context):
     if not isinstance(getattr(context, 'node', None), ast.Import):
         return None
     
-    issues = [blacklist.blacklist_manager.check_blacklist("Import", alias.name, context) 
-              for alias in context.node.names]
-    return [issue for issue in issues if issue] or None
+    issues = None
+    for alias in context.node.names:
+        found = blacklist.blacklist_manager.check_blacklist("Import", alias.name, context)
+        if found:
+            if issues is None:
+                issues = []
+            issues.append(found)
+    return issues
 
 
 @test.checks("ImportFrom")
@@ -17,7 +17,7 @@ def class_pollution_issue(description="", confidence="MEDIUM"):
 
 
 # Pattern sets for classification
-SAFE_ATTRIBUTES = {
+SAFE_ATTRIBUTES = frozenset({
     'id', 'name', 'value', 'data', 'content', 'text', 'title', 'description',
     'type', 'kind', 'status', 'state', 'level', 'priority', 'category',
     'version', 'timestamp', 'created', 'updated', 'modified', 'author',
@@ -26,82 +26,131 @@ SAFE_ATTRIBUTES = {
     'search', 'filter', 'sort', 'count', 'length', 'size', 'empty',
     'config', 'settings', 'options', 'params', 'args', 'kwargs',
     'default', 'custom', 'user', 'system', 'global', 'local',
-}
+})
 
-DANGEROUS_ATTRIBUTES = {
+DANGEROUS_ATTRIBUTES = frozenset({
     '__class__', '__dict__', '__init__', '__new__', '__del__',
     '__getattr__', '__setattr__', '__delattr__', '__getattribute__',
     '__bases__', '__mro__', '__subclasses__', '__module__', '__name__',
     '__globals__', '__builtins__', '__code__', '__closure__',
     '__func__', '__self__', '__qualname__', '__annotations__',
     '__doc__', '__file__', '__package__', '__spec__',
-}
+})
 
-USER_INPUT_INDICATORS = {
+USER_INPUT_INDICATORS = frozenset({
     'input', 'get', 'post', 'request', 'query', 'params', 'args',
     'form', 'data', 'body', 'json', 'xml', 'yaml', 'csv',
     'load', 'parse', 'decode', 'deserialize', 'unmarshal',
     'read', 'open', 'file', 'stream', 'socket', 'network',
     'url', 'path', 'filename', 'content', 'message', 'payload',
+})
+
+# An indicator that contains another one can never be the only match, so the
+# substring scan in _name_is_user_input only needs the minimal ones
+_USER_INPUT_SUBSTRINGS = tuple(sorted(
+    indicator for indicator in USER_INPUT_INDICATORS
+    if not any(other != indicator and other in indicator for other in USER_INPUT_INDICATORS)
+))
+
+_USER_INPUT_NAMES = frozenset({'request', 'req', 'params', 'args', 'kwargs', 'data', 'form'})
+_USER_INPUT_METHODS = frozenset({'get', 'post', 'input', 'read', 'load', 'parse'})
+_USER_INPUT_OBJECTS = frozenset({'request', 'req', 'self'})
+_USER_INPUT_ATTRIBUTES = frozenset({'args', 'form', 'data', 'json', 'values', 'get', 'post'})
+
+# Qualnames shared by the on_qualname dispatch and the checks' own guards
+_MERGE_FUNCTIONS = frozenset({"dict.update", "object.__setattr__"})
+_NAMESPACE_FUNCTIONS = frozenset({"vars", "globals", "locals"})
+
+
+def _constant_string(node):
+    return node.value if isinstance(node.value, str) else None
+
+
+# Parsed trees only contain these concrete node classes (ast.Str literals are
+# ast.Constant), so the helpers below dispatch on the exact node type with a
+# single dict lookup instead of walking an isinstance chain.
+_STRING_EXTRACTORS = {
+    ast.Constant: _constant_string,
+    ast.Name: lambda node: node.id,
 }
 
 
 def _get_string_value(node):
     """Extract string value from AST node"""
-    if isinstance(node, ast.Str):
-        return node.s
-    elif isinstance(node, ast.Constant) and isinstance(node.value, str):
-        return node.value
-    elif isinstance(node, ast.Name):
-        return node.id
-    return None
+    extract = _STRING_EXTRACTORS.get(type(node))
+    return extract(node) if extract else None
+
+
+def _name_is_user_input(node):
+    name = node.id.lower()
+    return (name in _USER_INPUT_NAMES or
+            any(indicator in name for indicator in _USER_INPUT_SUBSTRINGS))
+
+
+def _call_is_user_input(node):
+    return (hasattr(node.func, 'attr') and
+            node.func.attr.lower() in _USER_INPUT_METHODS)
+
+
+def _attribute_is_user_input(node):
+    if not hasattr(node.value, 'id'):
+        return False
+    obj_name = node.value.id.lower()
+    return (obj_name in _USER_INPUT_OBJECTS and 
+            node.attr.lower() in _USER_INPUT_ATTRIBUTES)
+
+
+_USER_INPUT_CHECKS = {
+    ast.Name: _name_is_user_input,
+    ast.Call: _call_is_user_input,
+    ast.Attribute: _attribute_is_user_input,
+}
 
 
 def _is_user_input(node):
     """Check if node represents user input"""
-    if isinstance(node, ast.Name):
-        name = node.id.lower()
-        return (any(indicator in name for indicator in USER_INPUT_INDICATORS) or
-                name in {'request', 'req', 'params', 'args', 'kwargs', 'data', 'form'})
-    elif isinstance(node, ast.Call) and hasattr(node.func, 'attr'):
-        return node.func.attr.lower() in {'get', 'post', 'input', 'read', 'load', 'parse'}
-    elif isinstance(node, ast.Attribute) and hasattr(node.value, 'id'):
-        obj_name = node.value.id.lower()
-        return (obj_name in {'request', 'req', 'self'} and 
-                node.attr.lower() in {'args', 'form', 'data', 'json', 'values', 'get', 'post'})
-    return False
+    check = _USER_INPUT_CHECKS.get(type(node))
+    return check(node) if check else False
 
 
-def _is_dangerous_attr(node):
-    """Check if attribute name is dangerous"""
-    value = _get_string_value(node)
+def _is_dangerous_attr(value):
+    """Check if attribute name (as given by _get_string_value) is dangerous"""
     return value in DANGEROUS_ATTRIBUTES if value else False
 
 
-def _is_safe_attr(node):
-    """Check if attribute name is safe"""
-    value = _get_string_value(node)
+def _is_safe_attr(value):
+    """Check if attribute name (as given by _get_string_value) is safe"""
     return value in SAFE_ATTRIBUTES if value else False
 
 
+def _call_has_user_input_in_string(node):
+    if hasattr(node.func, 'attr') and node.func.attr in {'format', 'replace', 'join', 'strip'}:
+        return any(_is_user_input(arg) for arg in node.args)
+    return _is_user_input(node)
+
+
+_STRING_INPUT_CHECKS = {
+    ast.Name: _is_user_input,
+    ast.Attribute: _is_user_input,
+    ast.Call: _call_has_user_input_in_string,
+}
+
+
 def _has_user_input_in_string(node):
     """Check if string construction involves user input"""
-    if isinstance(node, (ast.Str, ast.Constant)):
-        return False
-    elif isinstance(node, ast.Name):
-        return _is_user_input(node)
-    elif isinstance(node, ast.Attribute):
-        return _is_user_input(node)
-    elif isinstance(node, ast.Call):
-        if hasattr(node.func, 'attr') and node.func.attr in {'format', 'replace', 'join', 'strip'}:
-            return any(_is_user_input(arg) for arg in node.args)
-        return _is_user_input(node)
-    elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
-        return _has_user_input_in_string(node.left) or _has_user_input_in_string(node.right)
-    elif isinstance(node, ast.Mod):
-        return (_has_user_input_in_string(node.left) or
-                any(_is_user_input(arg) for arg in 
-                    (node.right.elts if isinstance(node.right, ast.Tuple) else [node.right])))
+    # '+' chains are walked with an explicit stack, left operand first, so
+    # long concatenations cannot hit the recursion limit
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if type(node) is ast.BinOp:
+            if isinstance(node.op, ast.Add):
+                stack.append(node.right)
+                stack.append(node.left)
+            continue
+        check = _STRING_INPUT_CHECKS.get(type(node))
+        if check and check(node):
+            return True
     return False
 
 
@@ -120,9 +169,8 @@ def _has_validation(context):
     return False
 
 
-def _get_node_description(node):
-    """Get human-readable description of node"""
-    value = _get_string_value(node)
+def _get_node_description(node, value):
+    """Get human-readable description of node, given its _get_string_value"""
     if value:
         return f"'{value}'"
     elif isinstance(node, ast.Call):
@@ -134,24 +182,26 @@ def _get_node_description(node):
 
 
 @test.checks("Call")
+@test.on_qualname("setattr")
 @test.with_id("B701")
 def setattr_with_user_input(context):
     """Check for setattr() calls that might use user input for attribute names"""
     if context.call_function_name_qual == "setattr" and len(context.node.args) >= 2:
         attr_arg = context.node.args[1]
+        attr_name = _get_string_value(attr_arg)
         
-        if _has_validation(context) or _is_safe_attr(attr_arg):
+        if _has_validation(context) or _is_safe_attr(attr_name):
             return None
             
-        if _is_dangerous_attr(attr_arg):
+        if _is_dangerous_attr(attr_name):
             return class_pollution_issue(
-                f"setattr() called with dangerous attribute name: {_get_node_description(attr_arg)}",
+                f"setattr() called with dangerous attribute name: {_get_node_description(attr_arg, attr_name)}",
                 confidence="HIGH"
             )
         
         if _has_user_input_in_string(attr_arg):
             return class_pollution_issue(
-                f"setattr() called with user-controlled attribute name: {_get_node_description(attr_arg)}",
+                f"setattr() called with user-controlled attribute name: {_get_node_description(attr_arg, attr_name)}",
                 confidence="HIGH"
             )
             
@@ -163,10 +213,11 @@ def setattr_with_user_input(context):
 
 
 @test.checks("Call") 
+@test.on_qualname(*_MERGE_FUNCTIONS)
 @test.with_id("B702")
 def unsafe_object_merge(context):
     """Check for unsafe object merging patterns that could lead to class pollution"""
-    if context.call_function_name_qual in ["dict.update", "object.__setattr__"] and context.node.args:
+    if context.call_function_name_qual in _MERGE_FUNCTIONS and context.node.args:
         merge_arg = context.node.args[0]
         
         if _has_validation(context):
@@ -186,6 +237,7 @@ def unsafe_object_merge(context):
 
 
 @test.checks("Call")
+@test.on_qualname("dict.update")
 @test.with_id("B703") 
 def dynamic_attribute_assignment(context):
     """Check for dynamic attribute assignment patterns"""
@@ -241,14 +293,15 @@ def unsafe_dict_assignment(context):
                   isinstance(target.slice, ast.Index)):
                 
                 key_node = target.slice.value
+                key_name = _get_string_value(key_node)
                 if _has_user_input_in_string(key_node):
                     return class_pollution_issue(
-                        f"Dynamic __dict__ key assignment with user-controlled key: {_get_node_description(key_node)}",
+                        f"Dynamic __dict__ key assignment with user-controlled key: {_get_node_description(key_node, key_name)}",
                         confidence="HIGH"
                     )
-                elif _is_dangerous_attr(key_node):
+                elif _is_dangerous_attr(key_name):
                     return class_pollution_issue(
-                        f"Dynamic __dict__ assignment with dangerous key: {_get_node_description(key_node)}",
+                        f"Dynamic __dict__ assignment with dangerous key: {_get_node_description(key_node, key_name)}",
                         confidence="HIGH"
                     )
                 elif isinstance(key_node, ast.Name):
@@ -259,24 +312,26 @@ def unsafe_dict_assignment(context):
 
 
 @test.checks("Call")
+@test.on_qualname("getattr")
 @test.with_id("B705")
 def getattr_setattr_patterns(context):
     """Check for getattr/setattr patterns that might be exploitable"""
     if context.call_function_name_qual == "getattr" and len(context.node.args) >= 2:
         attr_arg = context.node.args[1]
+        attr_name = _get_string_value(attr_arg)
         
-        if _has_validation(context) or _is_safe_attr(attr_arg):
+        if _has_validation(context) or _is_safe_attr(attr_name):
             return None
             
-        if _is_dangerous_attr(attr_arg):
+        if _is_dangerous_attr(attr_name):
             return class_pollution_issue(
-                f"getattr() called with dangerous attribute name: {_get_node_description(attr_arg)}",
+                f"getattr() called with dangerous attribute name: {_get_node_description(attr_arg, attr_name)}",
                 confidence="HIGH"
             )
         
         if _has_user_input_in_string(attr_arg):
             return class_pollution_issue(
-                f"getattr() called with user-controlled attribute name: {_get_node_description(attr_arg)}",
+                f"getattr() called with user-controlled attribute name: {_get_node_description(attr_arg, attr_name)}",
                 confidence="HIGH"
             )
             
@@ -288,12 +343,13 @@ def getattr_setattr_patterns(context):
 
 
 @test.checks("Call")
+@test.on_qualname(*_NAMESPACE_FUNCTIONS)
 @test.with_id("B706")
 def vars_globals_locals_usage(context):
     """Check for usage of vars(), globals(), or locals() with user input"""
     func_name = context.call_function_name_qual
     
-    if func_name in ["vars", "globals", "locals"]:
+    if func_name in _NAMESPACE_FUNCTIONS:
         # Check for patterns like: vars().update(user_input)
         parent = getattr(context.node, '_bandit_parent', None)
         if (parent and isinstance(parent, ast.Call) and 
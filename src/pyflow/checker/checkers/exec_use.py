@@ -4,6 +4,7 @@ from ..core import test_properties as test
 
 
 @test.checks("Call")
+@test.on_qualname("exec")
 @test.with_id("B102")
 def exec_used(context):
     """Check for use of exec function"""
@@ -1,12 +1,40 @@
 # Check for hardcoded passwords
 import ast
-import re
+from itertools import islice
 
 from ..core import issue
 from ..core import test_properties as test
 
-RE_WORDS = "(pas+wo?r?d|pass(phrase)?|pwd|token|secrete?)"
-RE_CANDIDATES = re.compile(f"(^{RE_WORDS}$|_{RE_WORDS}_|^{RE_WORDS}_|_{RE_WORDS}$)", re.IGNORECASE)
+# A name is a candidate when one of its '_'-separated words matches
+# (pas+wo?r?d|pass(phrase)?|pwd|token|secrete?), case-insensitively.
+# The fixed alternatives are a set lookup, pas+wo?r?d is checked by hand.
+_CANDIDATE_WORDS = frozenset({"pass", "passphrase", "pwd", "token", "secret", "secrete"})
+
+
+def _is_candidate_word(word):
+    if word in _CANDIDATE_WORDS:
+        return True
+    # pas+wo?r?d: "pa", one or more "s", "w", an optional "o", an optional "r", "d"
+    if len(word) < 5 or not word.startswith("pas") or not word.endswith("d"):
+        return False
+    return word[3:-1].lstrip("s") in ("w", "wo", "wr", "wor")
+
+
+def _is_candidate(name):
+    """Check if name looks like it holds a password"""
+    if name.endswith("\n"):
+        # A regex '$' would also match before a single trailing newline
+        name = name[:-1]
+    return any(_is_candidate_word(word) for word in name.lower().split("_"))
+
+
+def _str_value(node):
+    """Get the value of a string literal node, or None for any other node"""
+    # Same test as isinstance(node, ast.Str), without the deprecated alias's
+    # Python-level __instancecheck__
+    if type(node) is ast.Constant and type(node.value) is str:
+        return node.value
+    return None
 
 
 def _report(value):
@@ -29,23 +57,26 @@ def hardcoded_password_string(context):
     if isinstance(parent, ast.Assign):
         # Look for "candidate='some_string'"
         for targ in parent.targets:
-            if isinstance(targ, ast.Name) and RE_CANDIDATES.search(targ.id):
-                return _report(node.s)
-            elif isinstance(targ, ast.Attribute) and RE_CANDIDATES.search(targ.attr):
-                return _report(node.s)
+            if isinstance(targ, ast.Name) and _is_candidate(targ.id):
+                return _report(node.value)
+            elif isinstance(targ, ast.Attribute) and _is_candidate(targ.attr):
+                return _report(node.value)
 
-    elif isinstance(parent, (ast.Subscript, ast.Index)) and RE_CANDIDATES.search(node.s):
+    elif isinstance(parent, (ast.Subscript, ast.Index)) and _is_candidate(node.value):
         # Look for "dict[candidate]='some_string'"
         grandparent = getattr(parent, '_bandit_parent', None)
-        if isinstance(grandparent, ast.Assign) and isinstance(grandparent.value, ast.Str):
-            return _report(grandparent.value.s)
+        if isinstance(grandparent, ast.Assign):
+            value = _str_value(grandparent.value)
+            if value is not None:
+                return _report(value)
 
     elif isinstance(parent, ast.Compare):
         # Look for "candidate == 'some_string'"
         left = parent.left
-        if isinstance(left, (ast.Name, ast.Attribute)) and RE_CANDIDATES.search(left.id if isinstance(left, ast.Name) else left.attr):
-            if parent.comparators and isinstance(parent.comparators[0], ast.Str):
-                return _report(parent.comparators[0].s)
+        if isinstance(left, (ast.Name, ast.Attribute)) and _is_candidate(left.id if isinstance(left, ast.Name) else left.attr):
+            value = _str_value(parent.comparators[0]) if parent.comparators else None
+            if value is not None:
+                return _report(value)
 
 
 @test.checks("Call")
@@ -54,8 +85,9 @@ def hardcoded_password_funcarg(context):
     """Check for hardcoded password function arguments"""
     # Look for "function(candidate='some_string')"
     for kw in context.node.keywords:
-        if isinstance(kw.value, ast.Str) and RE_CANDIDATES.search(kw.arg):
-            return _report(kw.value.s)
+        value = _str_value(kw.value)
+        if value is not None and _is_candidate(kw.arg):
+            return _report(value)
 
 
 @test.checks("FunctionDef")
@@ -63,19 +95,12 @@ def hardcoded_password_funcarg(context):
 def hardcoded_password_default(context):
     """Check for hardcoded password argument defaults"""
     # Look for "def function(candidate='some_string')"
-    defs = [None] * (
-        len(context.node.args.args) - len(context.node.args.defaults)
-    )
-    defs.extend(context.node.args.defaults)
+    args = context.node.args.args
+    defaults = context.node.args.defaults
 
-    # Go through all (param, value)s and look for candidates
-    for key, val in zip(context.node.args.args, defs):
+    # Defaults belong to the trailing parameters, so only pair up those
+    for key, val in zip(islice(args, max(len(args) - len(defaults), 0), None), defaults):
         if isinstance(key, (ast.Name, ast.arg)):
-            # Skip if the default value is None
-            if val is None or (
-                isinstance(val, (ast.Constant, ast.NameConstant))
-                and val.value is None
-            ):
-                continue
-            if isinstance(val, ast.Str) and RE_CANDIDATES.search(key.arg):
-                return _report(val.s)
+            value = _str_value(val)
+            if value is not None and _is_candidate(key.arg):
+                return _report(value)
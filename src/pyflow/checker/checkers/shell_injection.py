@@ -4,6 +4,8 @@ import ast
 from ..core import issue
 from ..core import test_properties as test
 
+_SHELL_FUNCTIONS = frozenset({"os.system", "os.popen", "commands.getstatusoutput"})
+
 
 def shell_injection_issue():
     """Create a shell injection issue"""
@@ -16,6 +18,7 @@ def shell_injection_issue():
 
 
 @test.checks("Call")
+@test.on_qualname("subprocess.Popen")
 @test.with_id("B602")
 def subprocess_popen_with_shell_equals_true(context):
     """Check for subprocess.Popen with shell=True"""
@@ -35,8 +38,9 @@ def subprocess_without_shell_equals_true(context):
 
 
 @test.checks("Call")
+@test.on_qualname(*_SHELL_FUNCTIONS)
 @test.with_id("B604")
 def any_other_function_with_shell_equals_true(context):
     """Check for other functions with shell=True"""
-    if context.call_function_name_qual in ["os.system", "os.popen", "commands.getstatusoutput"]:
+    if context.call_function_name_qual in _SHELL_FUNCTIONS:
         return shell_injection_issue()
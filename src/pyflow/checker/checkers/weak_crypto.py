@@ -4,6 +4,9 @@ import ast
 from ..core import issue
 from ..core import test_properties as test
 
+_AES_CONSTRUCTORS = frozenset({"Crypto.Cipher.AES.new", "AES.new"})
+_WEAK_HASHES = frozenset({"hashlib.md5", "hashlib.sha1"})
+
 
 def weak_crypto_issue():
     """Create a weak crypto issue"""
@@ -16,10 +19,11 @@ def weak_crypto_issue():
 
 
 @test.checks("Call")
+@test.on_qualname(*_AES_CONSTRUCTORS)
 @test.with_id("B303")
 def weak_cryptographic_key(context):
     """Check for weak cryptographic key sizes"""
-    if context.call_function_name_qual in ["Crypto.Cipher.AES.new", "AES.new"]:
+    if context.call_function_name_qual in _AES_CONSTRUCTORS:
         # Check for weak key sizes
         key_size = context.get_call_arg_value("key_size")
         if key_size and int(key_size) < 128:
@@ -27,10 +31,11 @@ def weak_cryptographic_key(context):
 
 
 @test.checks("Call")
+@test.on_qualname(*_WEAK_HASHES)
 @test.with_id("B304")
 def weak_hash_functions(context):
     """Check for weak hash functions"""
-    if context.call_function_name_qual in ["hashlib.md5", "hashlib.sha1"]:
+    if context.call_function_name_qual in _WEAK_HASHES:
         return issue.Issue(
             severity="MEDIUM",
             confidence="HIGH",
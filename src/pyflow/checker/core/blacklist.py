@@ -43,12 +43,33 @@ class BlacklistManager:
     
     def __init__(self):
         self.blacklists = {"Call": [], "Import": [], "ImportFrom": []}
+        self._exact = {}
+        self._wildcards = {}
         self._load_blacklists()
 
     def _load_blacklists(self):
         """Load all blacklist items"""
         self._load_call_blacklists()
         self._load_import_blacklists()
+        self._build_index()
+
+    def _build_index(self):
+        """Index the blacklist items of each node type by exact qualname
+
+        Patterns with a wildcard are kept apart, with the position of their
+        item, so the first matching item in list order still wins.
+        """
+        for node_type, items in self.blacklists.items():
+            exact = {}
+            wildcards = []
+            for pos, item in enumerate(items):
+                for pattern in item.qualnames:
+                    if "*" in pattern:
+                        wildcards.append((pos, item, pattern))
+                    else:
+                        exact.setdefault(pattern, (pos, item))
+            self._exact[node_type] = exact
+            self._wildcards[node_type] = wildcards
 
     def _load_call_blacklists(self):
         """Load blacklist items for function calls"""
@@ -203,11 +224,14 @@ class BlacklistManager:
 
     def check_blacklist(self, node_type, qualname, context):
         """Check if a qualified name is blacklisted"""
-        items = self.get_blacklist_items(node_type)
-        for item in items:
-            if item.matches(qualname):
-                return item.create_issue(context, qualname)
-        return None
+        found = self._exact.get(node_type, {}).get(qualname)
+        for pos, item, pattern in self._wildcards.get(node_type, ()):
+            if found is not None and pos >= found[0]:
+                break
+            if fnmatch.fnmatch(qualname, pattern):
+                found = (pos, item)
+                break
+        return found[1].create_issue(context, qualname) if found else None
 
 
 # Global blacklist manager instance
@@ -1,6 +1,8 @@
 # Security checker constants
 RANKING = ["UNDEFINED", "LOW", "MEDIUM", "HIGH"]
 RANKING_VALUES = {"UNDEFINED": 1, "LOW": 3, "MEDIUM": 5, "HIGH": 10}
+# Position of each ranking in RANKING, i.e. RANKING.index without the scan
+RANKING_INDEX = {rank: i for i, rank in enumerate(RANKING)}
 CRITERIA = [("SEVERITY", "UNDEFINED"), ("CONFIDENCE", "UNDEFINED")]
 
 # Add each ranking to globals for direct access
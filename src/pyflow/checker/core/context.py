@@ -4,6 +4,8 @@ from . import utils
 
 
 class Context:
+    __slots__ = ("_context",)
+
     def __init__(self, context_object=None):
         """Initialize with a context object or empty dict"""
         self._context = context_object or {}
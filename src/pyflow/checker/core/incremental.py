@@ -0,0 +1,55 @@
+# Incremental scan cache for the security checker
+import json
+import logging
+import os
+
+LOG = logging.getLogger(__name__)
+
+MANIFEST_PATH = os.path.join(".pyflow", "incremental-manifest.json")
+
+
+class IncrementalCache:
+    """Per-file scan results keyed by the SHA-256 of the file contents
+
+    The manifest is only trusted when it was written with the same settings
+    (pyflow version, loaded tests, nosec handling). Editing checker code
+    without a version bump is not detected; delete the manifest then.
+    """
+
+    def __init__(self, settings, path=MANIFEST_PATH):
+        self.path = path
+        self.settings = settings
+        self.files = {}
+        self._load()
+
+    def _load(self):
+        """Load the manifest, ignoring it if missing, corrupt or stale"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("settings") == self.settings:
+            self.files = data.get("files", {})
+        else:
+            LOG.debug("Ignoring stale incremental manifest: %s", self.path)
+
+    def get(self, fname, digest):
+        """Get the cached entry for fname if its contents are unchanged"""
+        entry = self.files.get(fname)
+        return entry if entry is not None and entry["sha256"] == digest else None
+
+    def put(self, fname, entry):
+        """Record the scan results of fname"""
+        self.files[fname] = entry
+
+    def save(self):
+        """Write the manifest back"""
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"settings": self.settings, "files": self.files}, f)
+        except OSError as e:
+            LOG.warning("Failed to save incremental manifest %s: %s", self.path, e)
@@ -1,8 +1,25 @@
 # Security issue representation
 import linecache
+import weakref
+
+from .constants import RANKING_INDEX
+
+
+# Lines of each stdin buffer, read once for all the issues found in it
+_stdin_cache = weakref.WeakKeyDictionary()
+
+
+def _stdin_lines(fdata):
+    lines = _stdin_cache.get(fdata)
+    if lines is None:
+        fdata.seek(0)
+        lines = _stdin_cache[fdata] = fdata.readlines()
+    return lines
 
 
 class Cwe:
+    __slots__ = ("id",)
+
     NOTSET = 0
     IMPROPER_INPUT_VALIDATION = 20
     PATH_TRAVERSAL = 22
@@ -49,10 +66,13 @@ class Cwe:
         return self.id != other.id
 
     def __hash__(self):
-        return id(self)
+        return hash(self.id)
 
 
 class Issue:
+    __slots__ = ("severity", "cwe", "confidence", "text", "ident", "fname", "fdata",
+                 "test", "test_id", "lineno", "col_offset", "end_col_offset", "linerange")
+
     def __init__(self, severity, cwe=0, confidence="UNDEFINED", text="", ident=None, 
                  lineno=None, test_id="", col_offset=-1, end_col_offset=0):
         self.severity = severity
@@ -74,9 +94,12 @@ class Issue:
             self.text, self.test_id, (self.ident or self.test), str(self.cwe),
             self.severity, self.confidence, self.fname, self.lineno, self.col_offset)
 
+    def match_key(self):
+        """The fields compared by __eq__, as a hashable tuple"""
+        return (self.text, self.severity, self.cwe.id, self.confidence, self.fname, self.test, self.test_id)
+
     def __eq__(self, other):
-        match_fields = ["text", "severity", "cwe", "confidence", "fname", "test", "test_id"]
-        return all(getattr(self, field) == getattr(other, field) for field in match_fields)
+        return self.match_key() == other.match_key()
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -86,9 +109,8 @@ class Issue:
 
     def filter(self, severity, confidence):
         """Filter on confidence and severity thresholds"""
-        from .constants import RANKING
-        return (RANKING.index(self.severity) >= RANKING.index(severity) and 
-                RANKING.index(self.confidence) >= RANKING.index(confidence))
+        return (RANKING_INDEX[self.severity] >= RANKING_INDEX[severity] and
+                RANKING_INDEX[self.confidence] >= RANKING_INDEX[confidence])
 
     def get_code(self, max_lines=3, tabbed=False):
         """Get lines of code from the file that generated this issue"""
@@ -96,15 +118,15 @@ class Issue:
         lmin = max(1, self.lineno - max_lines // 2)
         lmax = lmin + len(self.linerange) + max_lines - 1
 
-        if self.fname == "<stdin>":
-            self.fdata.seek(0)
-            for _ in range(1, lmin):
-                self.fdata.readline()
+        stdin = _stdin_lines(self.fdata) if self.fname == "<stdin>" else None
 
         tmplt = "%i\t%s" if tabbed else "%i %s"
         lines = []
         for line in range(lmin, lmax):
-            text = self.fdata.readline() if self.fname == "<stdin>" else linecache.getline(self.fname, line)
+            if stdin is not None:
+                text = stdin[line - 1] if line <= len(stdin) else b""
+            else:
+                text = linecache.getline(self.fname, line)
             if not text:
                 break
             if isinstance(text, bytes):
@@ -124,3 +146,25 @@ class Issue:
         if with_code:
             out["code"] = self.get_code(max_lines=max_lines)
         return out
+
+    def from_dict(self, data):
+        """Restore the issue from the output of as_dict"""
+        self.fname = data["filename"]
+        self.severity = data["issue_severity"]
+        self.cwe = Cwe(data["issue_cwe"].get("id", Cwe.NOTSET))
+        self.confidence = data["issue_confidence"]
+        self.text = data["issue_text"]
+        self.test = data["test_name"]
+        self.test_id = data["test_id"]
+        self.lineno = data["line_number"]
+        self.linerange = data["line_range"]
+        self.col_offset = data.get("col_offset", -1)
+        self.end_col_offset = data.get("end_col_offset", 0)
+        self.ident = data.get("ident")
+
+
+def issue_from_dict(data):
+    """Create an issue from the output of Issue.as_dict"""
+    i = Issue(severity=data["issue_severity"])
+    i.from_dict(data)
+    return i
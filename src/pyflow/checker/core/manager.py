@@ -1,6 +1,9 @@
 # Security checker manager
 import collections
+import concurrent.futures
 import fnmatch
+import functools
+import hashlib
 import io
 import json
 import logging
@@ -11,6 +14,7 @@ import tokenize
 import traceback
 
 from . import constants as b_constants
+from . import incremental
 from . import issue
 from . import metrics
 from . import node_visitor as b_node_visitor
@@ -24,8 +28,14 @@ NOSEC_COMMENT_TESTS = re.compile(r"(?:(B\d+|[a-z\d_]+),?)+", re.IGNORECASE)
 class SecurityManager:
     scope = []
 
-    def __init__(self, config, debug=False, verbose=False, quiet=False, profile=None, ignore_nosec=False):
-        """Initialize the security checker manager"""
+    def __init__(self, config, debug=False, verbose=False, quiet=False, profile=None, ignore_nosec=False,
+                 incremental=False, jobs=1):
+        """Initialize the security checker manager
+
+        With incremental, results of files whose contents did not change since
+        the last incremental run are reused from incremental.MANIFEST_PATH.
+        With jobs > 1, files are scanned by that many worker processes.
+        """
         self.debug = debug
         self.verbose = verbose
         self.quiet = quiet
@@ -39,6 +49,9 @@ class SecurityManager:
         self.metrics = metrics.Metrics()
         self.b_ts = b_test_set.SecurityTestSet(config, profile or {})
         self.scores = []
+        self.incremental = incremental
+        self.jobs = jobs
+        self._cache = None
 
     def get_skipped(self):
         """Get list of skipped files"""
@@ -103,35 +116,98 @@ class SecurityManager:
     def run_tests(self):
         """Run through all files in the scope"""
         new_files_list = list(self.files_list)
-
-        for fname in self.files_list:
-            LOG.debug("working on file : %s", fname)
-            try:
-                if fname == "-":
-                    fdata = io.BytesIO(os.fdopen(sys.stdin.fileno(), "rb", 0).read())
-                    new_files_list = ["<stdin>" if x == "-" else x for x in new_files_list]
-                    self._parse_file("<stdin>", fdata, new_files_list)
-                else:
-                    with open(fname, "rb") as fdata:
-                        self._parse_file(fname, fdata, new_files_list)
-            except OSError as e:
-                self.skipped.append((fname, e.strerror))
-                new_files_list.remove(fname)
+        if self.incremental:
+            self._cache = incremental.IncrementalCache(self._incremental_settings())
+
+        if self.jobs > 1 and len(self.files_list) > 1 and "-" not in self.files_list:
+            self._run_in_workers(new_files_list)
+        else:
+            for fname in self.files_list:
+                LOG.debug("working on file : %s", fname)
+                try:
+                    if fname == "-":
+                        fdata = io.BytesIO(os.fdopen(sys.stdin.fileno(), "rb", 0).read())
+                        new_files_list = ["<stdin>" if x == "-" else x for x in new_files_list]
+                        self._parse_file("<stdin>", fdata, new_files_list)
+                    else:
+                        with open(fname, "rb") as fdata:
+                            self._parse_file(fname, fdata, new_files_list)
+                except OSError as e:
+                    self.skipped.append((fname, e.strerror))
+                    new_files_list.remove(fname)
 
         self.files_list = new_files_list
         self.metrics.aggregate()
+        if self._cache is not None:
+            self._cache.save()
+
+    def _run_in_workers(self, new_files_list):
+        """Scan the files in worker processes, merging results in file order"""
+        scans = []
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.jobs, initializer=_init_worker,
+                initargs=(self.b_conf, self.b_ts.profile, self.ignore_nosec)) as executor:
+            for fname in self.files_list:
+                LOG.debug("working on file : %s", fname)
+                try:
+                    with open(fname, "rb") as fdata:
+                        data = fdata.read()
+                except OSError as e:
+                    # Recorded while merging, to keep skips in file order
+                    scans.append((fname, None, None, None, e.strerror))
+                    continue
+                digest = entry = future = None
+                if self._cache is not None:
+                    digest = hashlib.sha256(data).hexdigest()
+                    entry = self._cache.get(fname, digest)
+                if entry is None:
+                    future = executor.submit(_scan_in_worker, fname, data)
+                scans.append((fname, digest, entry, future, None))
+
+            for fname, digest, entry, future, read_error in scans:
+                if read_error is not None:
+                    self.skipped.append((fname, read_error))
+                    new_files_list.remove(fname)
+                    continue
+                if future is None:
+                    LOG.debug("unchanged since last run, using cached results: %s", fname)
+                    self._apply_entry(fname, entry)
+                    continue
+                entry, reason = future.result()
+                self._apply_entry(fname, entry)
+                if reason is not None:
+                    self.skipped.append((fname, reason))
+                    new_files_list.remove(fname)
+                elif digest is not None:
+                    entry["sha256"] = digest
+                    self._cache.put(fname, entry)
+
+    def _incremental_settings(self):
+        """Everything besides file contents that the cached results depend on"""
+        from pyflow import __version__
+        tests = sorted({test.__name__ for tests in self.b_ts.tests.values() for test in tests})
+        return {"version": __version__, "tests": tests, "ignore_nosec": self.ignore_nosec}
 
     def _parse_file(self, fname, fdata, new_files_list):
         """Parse a single file"""
         try:
             data = fdata.read()
-            lines = data.splitlines()
+            digest = None
+            if self._cache is not None and fname != "<stdin>":
+                digest = hashlib.sha256(data).hexdigest()
+                entry = self._cache.get(fname, digest)
+                if entry is not None:
+                    LOG.debug("unchanged since last run, using cached results: %s", fname)
+                    self._apply_entry(fname, entry)
+                    return
+            before = self._metric_counts()
             self.metrics.begin(fname)
-            self.metrics.count_locs(lines)
+            self.metrics.count_locs(_count_lines(data))
             
-            # Parse nosec comments
+            # Parse nosec comments. A file without the marker anywhere has
+            # none, so the (slow) tokenizer only runs when it could find one.
             nosec_lines = {}
-            if not self.ignore_nosec:
+            if not self.ignore_nosec and b"nosec" in data:
                 try:
                     fdata.seek(0)
                     for toktype, tokval, (lineno, _), _, _ in tokenize.tokenize(fdata.readline):
@@ -140,9 +216,14 @@ class SecurityManager:
                 except tokenize.TokenError:
                     pass
                 
+            first_result = len(self.results)
             score = self._execute_ast_visitor(fname, fdata, data, nosec_lines)
             self.scores.append(score)
             self.metrics.count_issues([score])
+            if digest is not None:
+                entry = self._make_entry(score, first_result, before)
+                entry["sha256"] = digest
+                self._cache.put(fname, entry)
         except KeyboardInterrupt:
             sys.exit(2)
         except SyntaxError:
@@ -157,6 +238,37 @@ class SecurityManager:
             LOG.debug("  Exception string: %s", e)
             LOG.debug("  Exception traceback: %s", traceback.format_exc())
 
+    def _metric_counts(self):
+        """Snapshot of the per-file metric counters, for _make_entry"""
+        return self.metrics.lines, self.metrics.nosec, self.metrics.skipped
+
+    def _make_entry(self, score, first_result, before):
+        """Record the scan of one file as plain data, see _apply_entry
+
+        first_result is the index of its first issue in self.results, before
+        the _metric_counts taken before the file was scanned. score is None
+        for a file that could not be scanned.
+        """
+        lines, nosec, skipped_tests = before
+        return {
+            "loc": self.metrics.lines - lines, "score": score,
+            "nosec": self.metrics.nosec - nosec,
+            "skipped_tests": self.metrics.skipped - skipped_tests,
+            "issues": [dict(i.as_dict(with_code=False), ident=i.ident)
+                       for i in self.results[first_result:]],
+        }
+
+    def _apply_entry(self, fname, entry):
+        """Account for a file from a recorded scan instead of scanning it"""
+        self.metrics.begin(fname)
+        self.metrics.count_locs(entry["loc"])
+        self.metrics.nosec += entry["nosec"]
+        self.metrics.skipped += entry["skipped_tests"]
+        self.results.extend(issue.issue_from_dict(data) for data in entry["issues"])
+        if entry["score"] is not None:
+            self.scores.append(entry["score"])
+            self.metrics.count_issues([entry["score"]])
+
     def _execute_ast_visitor(self, fname, fdata, data, nosec_lines):
         """Execute AST parse on each file"""
         res = b_node_visitor.SecurityNodeVisitor(fname, fdata, self.b_ts, self.debug, nosec_lines, self.metrics)
@@ -165,6 +277,34 @@ class SecurityManager:
         return score
 
 
+# The manager of a worker process started by SecurityManager._run_in_workers
+_worker_manager = None
+
+
+def _init_worker(config, profile, ignore_nosec):
+    global _worker_manager
+    _worker_manager = SecurityManager(config, quiet=True, profile=profile, ignore_nosec=ignore_nosec)
+
+
+def _scan_in_worker(fname, data):
+    """Scan one file, returning its entry and why it was skipped (or None)"""
+    manager = _worker_manager
+    manager.results, manager.scores, manager.skipped = [], [], []
+    before = manager._metric_counts()
+    manager._parse_file(fname, io.BytesIO(data), [fname])
+    score = manager.scores[0] if manager.scores else None
+    reason = manager.skipped[0][1] if manager.skipped else None
+    return manager._make_entry(score, 0, before), reason
+
+
+def _count_lines(data):
+    """Same as len(data.splitlines()), without building the list"""
+    if not data:
+        return 0
+    count = data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+    return count if data.endswith((b"\n", b"\r")) else count + 1
+
+
 def _get_files_from_dir(files_dir, included_globs=None, excluded_path_strings=None):
     """Get files from a directory"""
     included_globs = included_globs or ["*.py"]
@@ -191,30 +331,48 @@ def _is_file_included(path, included_globs, excluded_path_strings, enforce_glob=
     return not (_matches_glob_list(path, excluded_path_strings) or any(x in path for x in excluded_path_strings))
 
 
+@functools.lru_cache(maxsize=32)
+def _glob_list_regex(globs):
+    """Compile a tuple of globs into one regex that matches like fnmatch.fnmatch"""
+    if not globs:
+        return None
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(glob)) for glob in globs))
+
+
 def _matches_glob_list(filename, glob_list):
     """Check if filename matches any glob in the list"""
-    return any(fnmatch.fnmatch(filename, glob) for glob in glob_list)
+    regex = _glob_list_regex(tuple(glob_list))
+    return regex is not None and regex.match(os.path.normcase(filename)) is not None
 
 
 def _compare_baseline_results(baseline, results):
     """Compare a baseline list of issues to list of results"""
-    return [a for a in results if a not in baseline]
+    baseline_keys = {i.match_key() for i in baseline}
+    return [a for a in results if a.match_key() not in baseline_keys]
 
 
 def _find_candidate_matches(unmatched_issues, results_list):
     """Returns a dictionary with issue candidates"""
-    return collections.OrderedDict((unmatched, [i for i in results_list if unmatched == i]) 
+    candidates = collections.defaultdict(list)
+    for i in results_list:
+        candidates[i.match_key()].append(i)
+    return collections.OrderedDict((unmatched, list(candidates[unmatched.match_key()]))
                                   for unmatched in unmatched_issues)
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_nosec_comment(comment):
-    """Parse nosec comment to extract test IDs"""
+    """Parse nosec comment to extract test IDs
+
+    The same comment text tends to repeat across a codebase, so results are
+    cached; they are frozensets so the shared values cannot be modified.
+    """
     found_no_sec_comment = NOSEC_COMMENT.search(comment)
     if not found_no_sec_comment:
         return None
 
     nosec_tests = found_no_sec_comment.groupdict().get("tests", set())
     if not nosec_tests:
-        return set()
+        return frozenset()
     
-    return {test.group(1) for test in NOSEC_COMMENT_TESTS.finditer(nosec_tests)}
+    return frozenset(test.group(1) for test in NOSEC_COMMENT_TESTS.finditer(nosec_tests))
@@ -1,8 +1,13 @@
 # Security checker metrics
 import logging
 
+from .constants import RANKING
+
 LOG = logging.getLogger(__name__)
 
+# Score positions that are counted, with their names (UNDEFINED is not)
+_COUNTED_RANKS = tuple(enumerate(RANKING))[1:]
+
 
 class Metrics:
     def __init__(self):
@@ -19,26 +24,20 @@ class Metrics:
         self.files += 1
         LOG.debug("Processing file: %s", filename)
 
-    def count_locs(self, lines):
+    def count_locs(self, count):
         """Count lines of code"""
-        self.lines += len(lines)
+        self.lines += count
 
     def count_issues(self, scores_list):
         """Count issues from scores"""
         for scores in scores_list:
             if scores and isinstance(scores, dict):
-                for sev_idx, count in enumerate(scores["SEVERITY"]):
-                    if count > 0:
-                        sev = ["UNDEFINED", "LOW", "MEDIUM", "HIGH"][sev_idx]
-                        if sev in self.issues_by_severity:
-                            self.issues_by_severity[sev] += count
-                            self.issues += count
-
-                for conf_idx, count in enumerate(scores["CONFIDENCE"]):
-                    if count > 0:
-                        conf = ["UNDEFINED", "LOW", "MEDIUM", "HIGH"][conf_idx]
-                        if conf in self.issues_by_confidence:
-                            self.issues_by_confidence[conf] += count
+                severity = scores["SEVERITY"]
+                confidence = scores["CONFIDENCE"]
+                for idx, rank in _COUNTED_RANKS:
+                    self.issues_by_severity[rank] += severity[idx]
+                    self.issues_by_confidence[rank] += confidence[idx]
+                    self.issues += severity[idx]
 
     def note_nosec(self):
         """Note a nosec comment"""
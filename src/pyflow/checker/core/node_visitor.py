@@ -50,7 +50,7 @@ class SecurityNodeVisitor:
         qualname = b_utils.get_call_name(node, self.import_aliases)
         name = qualname.split(".")[-1]
         self.context.update({"qualname": qualname, "name": name})
-        self.update_scores(self.tester.run_tests(self.context, "Call"))
+        self.update_scores(self.tester.run_tests(self.context, "Call", qualname))
 
     def visit_Import(self, node):
         """Visitor for AST Import nodes"""
@@ -19,6 +19,14 @@ def checks(*args):
     return wrapper
 
 
+def on_qualname(*names):
+    """Decorator to only run a Call test for calls to the given qualnames"""
+    def wrapper(func):
+        func._qualnames = frozenset(names).union(getattr(func, "_qualnames", ()))
+        return func
+    return wrapper
+
+
 def with_id(id_val):
     """Test function identifier decorator"""
     def _has_id(func):
@@ -11,6 +11,7 @@ class SecurityTestSet:
         self.config = config
         self.profile = profile
         self.tests = {}
+        self._qualname_tests = {}
         self._load_tests()
 
     def _load_tests(self):
@@ -18,15 +19,30 @@ class SecurityTestSet:
         loader = test_loader.TestLoader()
         loader.load_tests(self)
 
-    def get_tests(self, checktype):
-        """Get tests for a specific check type"""
-        return self.tests.get(checktype, [])
+    def get_tests(self, checktype, qualname=None):
+        """Get tests for a specific check type
+
+        With a qualname, tests restricted by on_qualname to other calls are
+        left out. The filtered lists are cached, keeping registration order.
+        """
+        if qualname is None:
+            return self.tests.get(checktype, [])
+        key = (checktype, qualname)
+        tests = self._qualname_tests.get(key)
+        if tests is None:
+            tests = [
+                test for test in self.tests.get(checktype, [])
+                if qualname in getattr(test, "_qualnames", (qualname,))
+            ]
+            self._qualname_tests[key] = tests
+        return tests
 
     def add_test(self, test_func):
         """Add a test function to the test set"""
         if not hasattr(test_func, "_checks"):
             return
 
+        self._qualname_tests.clear()
         for check_type in test_func._checks:
             if check_type not in self.tests:
                 self.tests[check_type] = []
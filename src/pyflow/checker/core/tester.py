@@ -1,5 +1,4 @@
 # Security test runner
-import copy
 import logging
 from . import constants
 from . import context as b_context
@@ -17,19 +16,22 @@ class SecurityTester:
         self.nosec_lines = nosec_lines
         self.metrics = metrics
 
-    def run_tests(self, raw_context, checktype):
-        """Run all tests for a certain type of check"""
+    def run_tests(self, raw_context, checktype, qualname=None):
+        """Run all tests for a certain type of check
+
+        For Call checks, qualname skips the tests registered for other calls.
+        """
         scores = {
             "SEVERITY": [0] * len(constants.RANKING),
             "CONFIDENCE": [0] * len(constants.RANKING),
         }
 
-        tests = self.testset.get_tests(checktype)
+        tests = self.testset.get_tests(checktype, qualname)
+        # Tests only read the context, so they can all share one, and the
+        # raw context needs no per-test copy
+        context = b_context.Context(raw_context)
         for test in tests:
             name = test.__name__
-            # Execute test with an instance of the context class
-            temp_context = copy.copy(raw_context)
-            context = b_context.Context(temp_context)
             try:
                 if hasattr(test, "_config"):
                     result = test(context, test._config)
@@ -42,22 +44,22 @@ class SecurityTester:
                     
                     for issue in issues:
                         nosec_tests_to_skip = self._get_nosecs_from_contexts(
-                            temp_context, test_result=issue
+                            raw_context, test_result=issue
                         )
 
-                        if isinstance(temp_context["filename"], bytes):
-                            issue.fname = temp_context["filename"].decode("utf-8")
+                        if isinstance(raw_context["filename"], bytes):
+                            issue.fname = raw_context["filename"].decode("utf-8")
                         else:
-                            issue.fname = temp_context["filename"]
-                        issue.fdata = temp_context["file_data"]
+                            issue.fname = raw_context["filename"]
+                        issue.fdata = raw_context["file_data"]
 
                         if issue.lineno is None:
-                            issue.lineno = temp_context["lineno"]
+                            issue.lineno = raw_context["lineno"]
                         if issue.linerange == []:
-                            issue.linerange = temp_context["linerange"]
+                            issue.linerange = raw_context["linerange"]
                         if issue.col_offset == -1:
-                            issue.col_offset = temp_context["col_offset"]
-                        issue.end_col_offset = temp_context.get("end_col_offset", 0)
+                            issue.col_offset = raw_context["col_offset"]
+                        issue.end_col_offset = raw_context.get("end_col_offset", 0)
                         issue.test = name
                         if issue.test_id == "":
                             issue.test_id = test._test_id
@@ -80,21 +82,21 @@ class SecurityTester:
                         self.results.append(issue)
 
                         LOG.debug("Issue identified by %s: %s", name, issue)
-                        sev = constants.RANKING.index(issue.severity)
+                        sev = constants.RANKING_INDEX[issue.severity]
                         val = constants.RANKING_VALUES[issue.severity]
                         scores["SEVERITY"][sev] += val
-                        con = constants.RANKING.index(issue.confidence)
+                        con = constants.RANKING_INDEX[issue.confidence]
                         val = constants.RANKING_VALUES[issue.confidence]
                         scores["CONFIDENCE"][con] += val
                 else:
-                    nosec_tests_to_skip = self._get_nosecs_from_contexts(temp_context)
+                    nosec_tests_to_skip = self._get_nosecs_from_contexts(raw_context)
                     if (
                         nosec_tests_to_skip
                         and test._test_id in nosec_tests_to_skip
                     ):
                         LOG.warning(
                             f"nosec encountered ({test._test_id}), but no "
-                            f"failed test on line {temp_context['lineno']}"
+                            f"failed test on line {raw_context['lineno']}"
                         )
 
             except Exception as e:
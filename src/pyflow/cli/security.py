@@ -39,6 +39,17 @@ def add_security_parser(subparsers):
         "--exclude", 
         help="Comma-separated list of paths to exclude"
     )
+    security_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse results for files unchanged since the last incremental run"
+    )
+    security_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes to scan files with"
+    )
 
 
 def run_security_analysis(targets, args):
@@ -57,7 +68,9 @@ def run_security_analysis(targets, args):
         config=config,
         debug=args.debug,
         verbose=args.verbose,
-        quiet=False
+        quiet=False,
+        incremental=args.incremental,
+        jobs=args.jobs
     )
     
     # Discover files
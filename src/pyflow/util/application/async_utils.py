@@ -5,13 +5,32 @@ import functools
 
 enabled = True
 
+# Threads started by the decorators below that have not finished yet.
+_live = set()
+
+
+def _start_thread(func, args, kargs):
+    def run():
+        try:
+            func(*args, **kargs)
+        finally:
+            _live.discard(t)
+
+    t = threading.Thread(target=run)
+    _live.add(t)
+    t.start()
+    return t
+
+
+def live_threads():
+    """Threads started by async_func / async_limited that are still running"""
+    return list(_live)
+
 
 def async_func(func):
     @functools.wraps(func)
     def async_wrapper(*args, **kargs):
-        t = threading.Thread(target=func, args=args, kwargs=kargs)
-        t.start()
-        return t
+        return _start_thread(func, args, kargs)
 
     if enabled:
         return async_wrapper
@@ -33,9 +52,7 @@ def async_limited(count):
         @functools.wraps(func)
         def limited_wrap(*args, **kargs):
             semaphore.acquire()
-            t = threading.Thread(target=thread_wrap, args=args, kwargs=kargs)
-            t.start()
-            return t
+            return _start_thread(thread_wrap, args, kargs)
 
         if enabled:
             return limited_wrap
@@ -0,0 +1,66 @@
+import copy
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from pyflow.checker.core import incremental
+from pyflow.checker.core.config import SecurityConfig
+from pyflow.checker.core.manager import SecurityManager
+
+# A small corpus with issues, a nosec comment and a file that fails to parse
+CORPUS = {
+    "shell.py": (
+        "import subprocess\n"
+        "import os\n"
+        "subprocess.Popen('ls', shell=True)\n"
+        "os.system('ls')\n"
+    ),
+    "crypto.py": (
+        "import hashlib\n"
+        "hashlib.md5(b'x')\n"
+        "hashlib.sha1(b'x')  # nosec\n"
+    ),
+    "password.py": (
+        "password = 'hunter2'\n"
+        "def login(user, passwd='secret'):\n"
+        "    return user\n"
+    ),
+    "clean.py": "def add(a, b):\n    return a + b\n",
+    "broken.py": "def broken(:\n",
+}
+
+
+class CheckerTestBase(TestCase):
+    """Runs the security checker inside a temporary copy of CORPUS"""
+
+    def setUp(self):
+        self.old_cwd = os.getcwd()
+        self.tmp_dir = tempfile.mkdtemp()
+        os.chdir(self.tmp_dir)
+        for name, source in CORPUS.items():
+            self.write(name, source)
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, name, source):
+        with open(name, "w") as f:
+            f.write(source)
+
+    def scan(self, **kwargs):
+        """Scan the corpus and return everything a report is built from"""
+        manager = SecurityManager(SecurityConfig(), quiet=True, **kwargs)
+        manager.discover_files(["."], recursive=True)
+        manager.run_tests()
+        return {
+            "results": [i.as_dict() for i in manager.results],
+            "skipped": manager.get_skipped(),
+            "scores": manager.scores,
+            "files": manager.files_list,
+            "metrics": copy.deepcopy(vars(manager.metrics)),
+        }
+
+    def manifest_exists(self):
+        return os.path.exists(incremental.MANIFEST_PATH)
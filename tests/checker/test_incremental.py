@@ -0,0 +1,77 @@
+import json
+import unittest
+
+from pyflow.checker.core import incremental
+
+from .base import CheckerTestBase
+
+
+class TestIncrementalScan(CheckerTestBase):
+    def load_manifest(self):
+        with open(incremental.MANIFEST_PATH) as f:
+            return json.load(f)
+
+    def save_manifest(self, manifest):
+        with open(incremental.MANIFEST_PATH, "w") as f:
+            json.dump(manifest, f)
+
+    def drop_cached_issues(self):
+        """Empty the cached issues, so a replay of the manifest is visible"""
+        manifest = self.load_manifest()
+        for entry in manifest["files"].values():
+            entry["issues"] = []
+        self.save_manifest(manifest)
+
+    def testSameAsFullScan(self):
+        expected = self.scan()
+        self.assertTrue(expected["results"])
+        self.assertFalse(self.manifest_exists())
+
+        self.assertEqual(self.scan(incremental=True), expected)
+        self.assertTrue(self.manifest_exists())
+        self.assertEqual(self.scan(incremental=True), expected)
+
+    def testManifestEntries(self):
+        self.scan(incremental=True)
+        files = self.load_manifest()["files"]
+        # Files that could not be scanned are not cached
+        self.assertEqual(sorted(files), ["./clean.py", "./crypto.py", "./password.py", "./shell.py"])
+        self.assertEqual(files["./crypto.py"]["nosec"], 1)
+
+    def testUnchangedFilesReplayed(self):
+        self.scan(incremental=True)
+        self.drop_cached_issues()
+        self.assertEqual(self.scan(incremental=True)["results"], [])
+
+    def testChangedFileRescanned(self):
+        self.scan(incremental=True)
+        self.drop_cached_issues()
+        self.write("clean.py", "import os\nos.popen('ls')\n")
+
+        result = self.scan(incremental=True)
+        self.assertEqual([i["filename"] for i in result["results"]], ["./clean.py"])
+        self.assertEqual(result["metrics"], self.scan()["metrics"])
+
+    def testStaleManifestIgnored(self):
+        expected = self.scan()
+        self.scan(incremental=True)
+        self.drop_cached_issues()
+        manifest = self.load_manifest()
+        manifest["settings"]["version"] = "0.0.0"
+        self.save_manifest(manifest)
+
+        self.assertEqual(self.scan(incremental=True), expected)
+        self.assertNotEqual(self.load_manifest()["settings"]["version"], "0.0.0")
+
+    def testCorruptManifestIgnored(self):
+        expected = self.scan()
+        self.scan(incremental=True)
+        with open(incremental.MANIFEST_PATH, "w") as f:
+            f.write("{not json")
+
+        self.assertEqual(self.scan(incremental=True), expected)
+        self.assertIn("files", self.load_manifest())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import os
+import shutil
+import unittest
+
+from .base import CheckerTestBase
+
+
+class TestWorkerScan(CheckerTestBase):
+    def setUp(self):
+        super().setUp()
+        # A file that is listed but cannot be opened
+        os.symlink("missing.py", "unreadable.py")
+
+    def clear_manifest(self):
+        shutil.rmtree(".pyflow", ignore_errors=True)
+
+    def testSameAsSerial(self):
+        expected = self.scan(jobs=1)
+        self.assertEqual(
+            [name for name, _ in expected["skipped"]], ["./broken.py", "./unreadable.py"]
+        )
+        self.assertEqual(self.scan(jobs=2), expected)
+
+    def testIncremental(self):
+        expected = self.scan(jobs=1)
+
+        self.assertEqual(self.scan(jobs=2, incremental=True), expected)
+        self.assertEqual(self.scan(jobs=2, incremental=True), expected)
+        self.assertEqual(self.scan(jobs=1, incremental=True), expected)
+
+        self.clear_manifest()
+        self.assertEqual(self.scan(jobs=1, incremental=True), expected)
+        self.assertEqual(self.scan(jobs=2, incremental=True), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from pyflow.analysis.dataflowIR import graph as df
+from pyflow.analysis.ddg.construction import DDGConstructor
+from pyflow.analysis.ddg.graph import KIND_MEMORY
+
+
+class HeapOp(object):
+    __slots__ = "heapReads", "heapModifies"
+
+    def __init__(self, reads=None, modifies=None):
+        self.heapReads = reads or {}
+        self.heapModifies = modifies or {}
+
+
+class TestMemoryDependencies(unittest.TestCase):
+    def connect(self, *ops):
+        constructor = DDGConstructor()
+        for op in ops:
+            constructor.ddg.get_or_create_op_node(op)
+        constructor._connect_memory_dependencies()
+        return list(constructor.ddg.iter_edges())
+
+    def testReadAfterWrite(self):
+        writer = HeapOp(modifies={"x": df.FieldNode(None, "x")})
+        reader = HeapOp(reads={"x": df.FieldNode(None, "x")})
+        self.assertEqual(self.connect(writer, reader), [(0, 1, KIND_MEMORY)])
+
+    def testNullReadHasNoWriter(self):
+        writer = HeapOp(modifies={"x": df.FieldNode(None, "x")})
+        reader = HeapOp(reads={"x": df.NullNode()})
+        self.assertEqual(self.connect(writer, reader), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+from pyflow.analysis.ddg.graph import DataDependenceGraph, KIND_DEF_USE, KIND_MEMORY
+
+
+class TestDataDependenceGraph(unittest.TestCase):
+    def setUp(self):
+        self.g = DataDependenceGraph()
+        self.ops = [self.g.get_or_create_op_node(("op", i)) for i in range(3)]
+        self.slots = [self.g.get_or_create_slot_node(("slot", i)) for i in range(2)]
+
+    def build(self):
+        ops, slots = self.ops, self.slots
+        self.g.add_def_use(slots[0], ops[1], "a")
+        self.g.add_def_use(ops[0], slots[0], "x")
+        self.g.add_mem_dep(ops[0], ops[2], "RAW")
+        self.g.add_def_use(ops[0], slots[1])
+
+    def testIterEdgesGroupsBySource(self):
+        self.build()
+        self.g.freeze()
+        self.assertEqual(
+            list(self.g.iter_edges()),
+            [
+                (0, 3, KIND_DEF_USE),
+                (0, 2, KIND_MEMORY),
+                (0, 4, KIND_DEF_USE),
+                (3, 1, KIND_DEF_USE),
+            ],
+        )
+        self.assertEqual(self.g.num_edges(), 4)
+
+    def testDedupe(self):
+        self.build()
+        self.g.add_def_use(self.ops[0], self.slots[0], "other")
+        self.g.add_mem_dep(self.ops[0], self.ops[2])
+        self.assertEqual(self.g.num_edges(), 4)
+
+        # Same endpoints with a different kind is a separate dependence
+        self.g.add_mem_dep(self.ops[0], self.slots[0])
+        self.assertEqual(self.g.num_edges(), 5)
+
+        labels = {(e.source.node_id, e.target.node_id, e.kind): e.label for e in self.g.all_edges()}
+        self.assertEqual(labels[(0, 3, KIND_DEF_USE)], "x")
+
+    def testAddAfterFreeze(self):
+        self.build()
+        self.g.freeze()
+        self.assertEqual(self.g.stats()["edges"], 4)
+
+        self.g.add_def_use(self.ops[2], self.slots[1])
+        self.g.add_def_use(self.ops[0], self.slots[0])
+        self.assertEqual(self.g.num_edges(), 5)
+        self.assertEqual(self.g.stats()["edges"], 5)
+        self.assertEqual(list(self.g.iter_edges())[-2], (2, 4, KIND_DEF_USE))
+
+        self.g.freeze()
+        self.assertEqual(self.g.num_edges(), 5)
+        self.assertEqual(len(list(self.g.iter_edges())), 5)
+
+    def testAddReturnsEdge(self):
+        edge = self.g.add_def_use(self.ops[0], self.slots[0], "x")
+        self.assertIs(edge.source, self.ops[0])
+        self.assertIs(edge.target, self.slots[0])
+        self.assertEqual((edge.kind, edge.label), (KIND_DEF_USE, "x"))
+
+        # A duplicate reports the dependence that is already stored
+        self.assertEqual(self.g.add_def_use(self.ops[0], self.slots[0], "y").label, "x")
+
+    def testNodeEdgeViews(self):
+        self.build()
+        self.assertEqual(
+            [(e.target.node_id, e.kind, e.label) for e in self.ops[0].edges_out],
+            [(3, KIND_DEF_USE, "x"), (2, KIND_MEMORY, "RAW"), (4, KIND_DEF_USE, "")],
+        )
+        self.assertEqual([e.source for e in self.slots[0].edges_in], [self.ops[0]])
+        self.assertEqual(self.ops[1].edges_out, ())
+
+        # The views follow edges added after they were first read
+        self.g.add_def_use(self.ops[2], self.slots[0])
+        self.assertEqual([e.source for e in self.slots[0].edges_in], [self.ops[0], self.ops[2]])
+
+    def testEmpty(self):
+        self.g.freeze()
+        self.assertEqual(list(self.g.iter_edges()), [])
+        self.assertEqual(self.g.stats(), {"nodes": 5, "edges": 0, "ops": 3, "slots": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()